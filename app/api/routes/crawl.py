@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.schemas.job import CrawlMessage, JobCreatedResponse, JobStatus, JobType
 from app.services.job_service import JobService
-from app.services.queue_service import queue_publisher
+from app.services.queue_service import QueuePublisher, get_queue_publisher
 
 router = APIRouter(prefix="/crawl", tags=["Crawl"])
 
@@ -21,6 +21,7 @@ router = APIRouter(prefix="/crawl", tags=["Crawl"])
 async def _schedule_job(
     job_type: JobType,
     db: AsyncSession,
+    publisher: QueuePublisher,
 ) -> JobCreatedResponse:
     """
     Helper compartilhado: cria job, publica na fila e retorna resposta.
@@ -32,7 +33,7 @@ async def _schedule_job(
 
     # Etapa 2: publicar na fila para o worker processar
     message = CrawlMessage(job_id=job.id, job_type=job_type)
-    await queue_publisher.publish(message)
+    await publisher.publish(message)
 
     return JobCreatedResponse(
         job_id=job.id,
@@ -49,12 +50,13 @@ async def _schedule_job(
 )
 async def schedule_hockey_crawl(
     db: AsyncSession = Depends(get_db),
+    publisher: QueuePublisher = Depends(get_queue_publisher),
 ) -> JobCreatedResponse:
     """
     Agenda a coleta de dados do site de times de hockey.
     Retorna o job_id para acompanhamento via GET /jobs/{job_id}.
     """
-    return await _schedule_job(JobType.HOCKEY, db)
+    return await _schedule_job(JobType.HOCKEY, db, publisher)
 
 
 @router.post(
@@ -65,12 +67,13 @@ async def schedule_hockey_crawl(
 )
 async def schedule_oscar_crawl(
     db: AsyncSession = Depends(get_db),
+    publisher: QueuePublisher = Depends(get_queue_publisher),
 ) -> JobCreatedResponse:
     """
     Agenda a coleta de filmes vencedores do Oscar.
     Retorna o job_id para acompanhamento via GET /jobs/{job_id}.
     """
-    return await _schedule_job(JobType.OSCAR, db)
+    return await _schedule_job(JobType.OSCAR, db, publisher)
 
 
 @router.post(
@@ -81,9 +84,10 @@ async def schedule_oscar_crawl(
 )
 async def schedule_all_crawl(
     db: AsyncSession = Depends(get_db),
+    publisher: QueuePublisher = Depends(get_queue_publisher),
 ) -> JobCreatedResponse:
     """
     Agenda a coleta de todas as fontes (hockey + oscar) em um único job.
     Retorna o job_id para acompanhamento via GET /jobs/{job_id}.
     """
-    return await _schedule_job(JobType.ALL, db)
+    return await _schedule_job(JobType.ALL, db, publisher)
@@ -4,11 +4,14 @@ Rotas de gerenciamento de Jobs — GET /jobs e GET /jobs/{job_id}
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.schemas.job import JobResponse
+from app.services.cache_service import JOBS_NAMESPACE, cache_key, response_cache
 from app.services.job_service import JobService
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
@@ -20,12 +23,23 @@ router = APIRouter(prefix="/jobs", tags=["Jobs"])
     summary="Listar todos os jobs",
 )
 async def list_jobs(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> list[JobResponse]:
-    """Retorna todos os jobs ordenados do mais recente ao mais antigo."""
-    service = JobService(db)
-    jobs = await service.list_jobs()
-    return jobs  # type: ignore[return-value]
+) -> Response:
+    """
+    Retorna todos os jobs ordenados do mais recente ao mais antigo.
+    As linhas do banco são serializadas direto com orjson (o response_model
+    serve apenas à documentação) e ficam em cache por poucos segundos.
+    """
+
+    async def build() -> bytes:
+        rows = await JobService(db).list_jobs()
+        return orjson.dumps([dict(row) for row in rows])
+
+    body = await response_cache.get_or_set(
+        JOBS_NAMESPACE, cache_key(request), settings.jobs_cache_ttl, build
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -2,24 +2,43 @@
 Rotas de consulta de resultados coletados.
 
   GET /jobs/{job_id}/results → resultados de um job específico
-  GET /results/hockey        → todos os dados de hockey
-  GET /results/oscar         → todos os dados do oscar
+  GET /results/hockey        → dados de hockey (paginado por cursor)
+  GET /results/oscar         → dados do oscar (paginado por cursor)
 """
 
+import asyncio
+import hashlib
 import uuid
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_session_factory
+from app.models.hockey import HockeyTeam
+from app.models.oscar import OscarFilm
 from app.schemas.hockey import HockeyTeamResponse
 from app.schemas.job import JobType
 from app.schemas.oscar import OscarFilmResponse
+from app.services.cache_service import RESULTS_NAMESPACE, cache_key, response_cache
 from app.services.job_service import JobService
 
 router = APIRouter(tags=["Results"])
 
+# Adapters compilados uma única vez para validar listas de resultados
+_HOCKEY_LIST = TypeAdapter(list[HockeyTeamResponse])
+_OSCAR_LIST = TypeAdapter(list[OscarFilmResponse])
+
+# Paginação por cursor (keyset) das listagens globais
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
 
 # ──────────────────────────────────────────────────────────────
 # Resultados por job específico
@@ -30,11 +49,17 @@ router = APIRouter(tags=["Results"])
 )
 async def get_job_results(
     job_id: uuid.UUID,
+    count_only: bool = Query(False, description="Retorna apenas as contagens, sem os dados"),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> Response:
     """
     Retorna os dados coletados por um job específico.
-    O formato da resposta varia de acordo com o tipo do job.
+    O formato da resposta varia de acordo com o tipo do job; só a tabela do
+    tipo é consultada. As linhas vêm como mapeamentos de colunas (sem objetos
+    ORM) e são validadas e serializadas pelos TypeAdapters dos schemas.
+    Com `count_only=true` as contagens vêm de um COUNT no banco e as linhas
+    não são carregadas.
     """
     service = JobService(db)
 
@@ -46,74 +71,169 @@ async def get_job_results(
             detail=f"Job {job_id} não encontrado.",
         )
 
-    # Retorna os dados conforme o tipo do job
-    if job.type == JobType.HOCKEY:
-        records = await service.get_hockey_results_by_job(job_id)
-        return {
-            "job_id": str(job_id),
-            "type": job.type,
-            "status": job.status,
-            "count": len(records),
-            "data": [HockeyTeamResponse.model_validate(r) for r in records],
-        }
-
-    if job.type == JobType.OSCAR:
-        records = await service.get_oscar_results_by_job(job_id)
-        return {
-            "job_id": str(job_id),
-            "type": job.type,
-            "status": job.status,
-            "count": len(records),
-            "data": [OscarFilmResponse.model_validate(r) for r in records],
-        }
-
-    # Tipo ALL — retorna ambos
-    hockey = await service.get_hockey_results_by_job(job_id)
-    oscar = await service.get_oscar_results_by_job(job_id)
-    return {
+    payload: dict[str, Any] = {
         "job_id": str(job_id),
         "type": job.type,
         "status": job.status,
-        "hockey": {
-            "count": len(hockey),
-            "data": [HockeyTeamResponse.model_validate(r) for r in hockey],
-        },
-        "oscar": {
-            "count": len(oscar),
-            "data": [OscarFilmResponse.model_validate(r) for r in oscar],
-        },
     }
 
+    payload.update(await _job_sections(job.type, job_id, count_only, service, session_factory))
+    return _json_response(payload)
+
+
+async def _job_sections(
+    job_type: JobType,
+    job_id: uuid.UUID,
+    count_only: bool,
+    service: JobService,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> dict[str, Any]:
+    """
+    Blocos da resposta conforme o tipo do job. HOCKEY/OSCAR consultam só a
+    própria tabela; ALL consulta as duas em paralelo — uma AsyncSession não
+    aceita comandos concorrentes, então o Oscar usa uma segunda sessão/conexão.
+    """
+    if job_type != JobType.ALL:
+        return await _section(job_type, job_id, count_only, service)
+
+    async with session_factory() as oscar_db:
+        hockey, oscar = await asyncio.gather(
+            _section(JobType.HOCKEY, job_id, count_only, service),
+            _section(JobType.OSCAR, job_id, count_only, JobService(oscar_db)),
+        )
+    return {"hockey": hockey, "oscar": oscar}
+
+
+async def _section(
+    job_type: JobType, job_id: uuid.UUID, count_only: bool, service: JobService
+) -> dict[str, Any]:
+    """Bloco de uma tabela: {count} via COUNT no banco ou {count, data}."""
+    if job_type == JobType.HOCKEY:
+        if count_only:
+            return {"count": await service.count_hockey_results_by_job(job_id)}
+        return _data_section(_HOCKEY_LIST, await service.get_hockey_results_by_job(job_id))
+
+    if count_only:
+        return {"count": await service.count_oscar_results_by_job(job_id)}
+    return _data_section(_OSCAR_LIST, await service.get_oscar_results_by_job(job_id))
+
+
+def _data_section(adapter: TypeAdapter[list[Any]], rows: list[RowMapping]) -> dict[str, Any]:
+    """
+    Bloco {count, data}; com as linhas já carregadas, len() sai de graça.
+    A lista é validada pelo schema e serializada de uma vez (dump_json); o
+    orjson.Fragment embute esse JSON no payload sem decodificar de novo.
+    """
+    data = adapter.dump_json(adapter.validate_python(rows))
+    return {"count": len(rows), "data": orjson.Fragment(data)}
+
+
+def _json_response(payload: dict[str, Any]) -> Response:
+    """Serializa o payload com orjson, sem passar pelo jsonable_encoder."""
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
 
 # ──────────────────────────────────────────────────────────────
-# Todos os resultados de hockey (todos os jobs)
+# Todos os resultados de hockey (todos os jobs, paginado)
 # ──────────────────────────────────────────────────────────────
 @router.get(
     "/results/hockey",
     response_model=list[HockeyTeamResponse],
-    summary="Todos os dados de Hockey coletados",
+    summary="Dados de Hockey coletados (paginado)",
 )
 async def get_all_hockey(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: int | None = Query(None, description="id do último item da página anterior"),
     db: AsyncSession = Depends(get_db),
-) -> list[HockeyTeamResponse]:
-    """Retorna todos os registros de times de hockey de todos os jobs."""
+) -> Response:
+    """
+    Retorna uma página de times de hockey de todos os jobs, ordenada por id.
+    Para a próxima página, envie o `id` do último item como `cursor`.
+    """
     service = JobService(db)
-    records = await service.get_all_hockey_results()
-    return records  # type: ignore[return-value]
+    version = await service.get_results_version(HockeyTeam)
+    return await _paged_response(request, version, service.stream_hockey_page, limit, cursor)
 
 
 # ──────────────────────────────────────────────────────────────
-# Todos os resultados do Oscar (todos os jobs)
+# Todos os resultados do Oscar (todos os jobs, paginado)
 # ──────────────────────────────────────────────────────────────
 @router.get(
     "/results/oscar",
     response_model=list[OscarFilmResponse],
-    summary="Todos os dados do Oscar coletados",
+    summary="Dados do Oscar coletados (paginado)",
 )
 async def get_all_oscar(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: int | None = Query(None, description="id do último item da página anterior"),
     db: AsyncSession = Depends(get_db),
-) -> list[OscarFilmResponse]:
-    """Retorna todos os registros de filmes do Oscar de todos os jobs."""
+) -> Response:
+    """
+    Retorna uma página de filmes do Oscar de todos os jobs, ordenada por id.
+    Para a próxima página, envie o `id` do último item como `cursor`.
+    """
     service = JobService(db)
-    records = await service.get_all_oscar_results()
-    return records  # type: ignore[return-value]
+    version = await service.get_results_version(OscarFilm)
+    return await _paged_response(request, version, service.stream_oscar_page, limit, cursor)
+
+
+# ──────────────────────────────────────────────────────────────
+# ETag + serialização em streaming das páginas
+# ──────────────────────────────────────────────────────────────
+async def _paged_response(
+    request: Request,
+    version: int,
+    stream_page: Callable[[int, int | None], AsyncIterator[RowMapping]],
+    limit: int,
+    cursor: int | None,
+) -> Response:
+    """
+    Responde 304 se o cliente já tem a versão atual da página (ETag). Caso
+    contrário devolve a página do cache (se houver) ou busca no banco e
+    transmite o JSON linha a linha, gravando o payload no cache ao final.
+    """
+    key = cache_key(request, version)
+    headers = {
+        "ETag": _etag(key),
+        "Cache-Control": f"public, max-age={settings.results_http_max_age}",
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cached = await response_cache.get(RESULTS_NAMESPACE, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers=headers)
+
+    chunks = response_cache.stream_and_set(
+        RESULTS_NAMESPACE, key, settings.results_cache_ttl, _iter_json(stream_page(limit, cursor))
+    )
+    return StreamingResponse(chunks, media_type="application/json", headers=headers)
+
+
+def _etag(key: str) -> str:
+    """ETag fraca (o corpo pode ir comprimido) da chave versionada da consulta."""
+    digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Compara o ETag atual com o cabeçalho If-None-Match da requisição."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _iter_json(rows: AsyncIterator[RowMapping]) -> AsyncIterator[bytes]:
+    """Gera um array JSON serializando uma linha por vez com orjson."""
+    yield b"["
+    first = True
+    async for row in rows:
+        if not first:
+            yield b","
+        first = False
+        yield orjson.dumps(dict(row))
+    yield b"]"
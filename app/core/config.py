@@ -1,8 +1,14 @@
 """
 Configurações centralizadas da aplicação usando Pydantic Settings.
 Todas as variáveis de ambiente são lidas aqui e tipadas corretamente.
+
+As URLs derivadas (banco, RabbitMQ, Redis) são montadas uma única vez por
+instância (cached_property); alterar os campos depois do primeiro acesso não
+as atualiza.
 """
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +18,9 @@ class Settings(BaseSettings):
     # ──────────────────────────────────────────
     app_name: str = "Scraper RPA API"
     debug: bool = False
+    # Nível dos logs da API e do Worker (DEBUG=true força DEBUG). Os logs por
+    # job do Worker são DEBUG; em INFO sai uma linha por lote.
+    log_level: str = "INFO"
 
     # ──────────────────────────────────────────
     # PostgreSQL
@@ -22,7 +31,25 @@ class Settings(BaseSettings):
     postgres_password: str = "postgres"
     postgres_db: str = "scraper_db"
 
-    @property
+    # Pool de conexões do engine assíncrono
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # segundos; recicla conexões antes do timeout do servidor
+    db_pool_pre_ping: bool = False  # SELECT 1 a cada checkout; o recycle já cobre conexões velhas
+    db_command_timeout: int = 30  # segundos por comando (asyncpg)
+    # Prepared statements reaproveitados por conexão (asyncpg e dialeto do SQLAlchemy)
+    db_statement_cache_size: int = 500
+    # Atrás de um pgbouncer em modo transaction: sem pool local e sem prepared statements
+    db_use_pgbouncer: bool = False
+    # Commit dos resultados sem esperar o fsync do WAL (synchronous_commit=off).
+    # Uma queda do Postgres logo após o commit perde resultados e COMPLETED,
+    # mas a mensagem já recebeu ACK: o job fica RUNNING e não é reprocessado
+    db_results_async_commit: bool = False
+    # Roda create_all (introspecção do catálogo) no startup; desligue nos
+    # processos que não precisam criar o schema (ex.: réplicas do worker)
+    db_auto_create_tables: bool = True
+
+    @cached_property
     def database_url(self) -> str:
         """URL assíncrona para SQLAlchemy (asyncpg)."""
         return (
@@ -30,7 +57,7 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
         """URL síncrona para Alembic e Testcontainers."""
         return (
@@ -46,8 +73,10 @@ class Settings(BaseSettings):
     rabbitmq_user: str = "guest"
     rabbitmq_password: str = "guest"
     rabbitmq_vhost: str = "/"
+    # Mensagens entregues ao worker sem ACK (QoS); acompanhar a concorrência do worker
+    rabbitmq_prefetch: int = 4
 
-    @property
+    @cached_property
     def rabbitmq_url(self) -> str:
         """URL de conexão com o RabbitMQ."""
         return (
@@ -55,16 +84,63 @@ class Settings(BaseSettings):
             f"@{self.rabbitmq_host}:{self.rabbitmq_port}/{self.rabbitmq_vhost}"
         )
 
+    # ──────────────────────────────────────────
+    # Redis (cache de respostas da API)
+    # ──────────────────────────────────────────
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+    cache_enabled: bool = True
+    cache_prefix: str = "scraper"
+    results_cache_ttl: int = 300  # segundos
+    results_http_max_age: int = 60  # Cache-Control das listagens /results/*
+    jobs_cache_ttl: int = 5  # segundos
+
+    @cached_property
+    def redis_url(self) -> str:
+        """URL de conexão com o Redis."""
+        return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
+
     # ──────────────────────────────────────────
     # Nomes das filas
     # ──────────────────────────────────────────
     queue_name: str = "crawl_jobs"
 
+    # Mensagens de agendamento são transitórias por padrão (sem fsync por
+    # mensagem no broker); o job continua registrado no banco e pode ser
+    # reagendado. Fila "lazy" mantém o backlog em disco em vez de na RAM.
+    queue_persistent_messages: bool = False
+    queue_lazy: bool = False
+
+    # Exchange (fanout) que recebe as mensagens rejeitadas sem requeue; elas
+    # ficam na fila "<queue_name>.dead" para inspeção. Vazio (padrão) desliga:
+    # o argumento muda a declaração da fila, que numa fila existente falharia
+    queue_dead_letter_exchange: str = ""
+
+    # Com confirms desligados o lote é enviado sem aguardar ack do broker
+    # (mais vazão, mas um nack/perda de conexão não chega ao chamador)
+    queue_publisher_confirms: bool = True
+
+    # Publicação em lote: tamanho máximo e janela de espera do lote
+    publish_batch_size: int = 100
+    publish_batch_window_ms: int = 5
+
+    # Consumo em lote no worker: mensagens por lote (≤ prefetch) e espera
+    # máxima para completar o lote; o lote inteiro é confirmado com um só ACK
+    worker_batch_size: int = 4
+    worker_batch_timeout: float = 0.2  # segundos
+    # Jobs de um lote processados em paralelo (cada um com sua sessão de banco)
+    worker_concurrency: int = 4
+
     # ──────────────────────────────────────────
     # Selenium / WebDriver
     # ──────────────────────────────────────────
+    # Por padrão o OscarCrawler consulta o endpoint AJAX diretamente;
+    # o Selenium só é usado quando habilitado explicitamente.
+    oscar_use_selenium: bool = False
     selenium_headless: bool = True
     selenium_timeout: int = 30  # segundos
+    selenium_pool_size: int = 2  # máximo de drivers Chrome mantidos pelo worker
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -8,7 +8,12 @@ Etapas:
   4. Expõe `create_tables` para inicializar o schema no startup
 """
 
+import os
+import time
+import uuid
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -16,28 +21,81 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+
 # ──────────────────────────────────────────────────────────────
 # Engine assíncrono — pool de conexões gerenciado pelo SQLAlchemy
 # ──────────────────────────────────────────────────────────────
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,  # verifica conexões inativas antes de usar
-    pool_size=10,
-    max_overflow=20,
-)
+def _engine_options() -> dict[str, Any]:
+    """
+    Monta as opções do engine a partir das settings.
+    Sem pgbouncer, cada conexão do pool mantém um cache de prepared
+    statements, reaproveitando o plano dos INSERTs/SELECTs repetidos.
+    Com pgbouncer (modo transaction) o pool fica a cargo dele: usa NullPool
+    e desliga o cache de prepared statements do asyncpg.
+    """
+    connect_args: dict[str, Any] = {
+        "server_settings": {"jit": "off"},  # JIT só atrasa as consultas curtas da API
+        "command_timeout": settings.db_command_timeout,
+    }
+
+    if settings.db_use_pgbouncer:
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        return {"poolclass": NullPool, "connect_args": connect_args}
+
+    connect_args["statement_cache_size"] = settings.db_statement_cache_size
+    connect_args["prepared_statement_cache_size"] = settings.db_statement_cache_size
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
 
-# Fábrica de sessões assíncronas
+
+engine = create_async_engine(settings.database_url, echo=settings.debug, **_engine_options())
+
+# Fábrica de sessões assíncronas. As escritas usam Core (insert/update/
+# delete), nunca session.add(), então não há o que autoflush antes das
+# consultas — desligado para pular a varredura do identity map.
 AsyncSessionFactory = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
 )
 
 
+# ──────────────────────────────────────────────────────────────
+# Timestamps — default/onupdate compartilhado pelas models
+# ──────────────────────────────────────────────────────────────
+def utcnow() -> datetime:
+    """Data/hora atual em UTC (timezone-aware)."""
+    return datetime.now(UTC)
+
+
+# ──────────────────────────────────────────────────────────────
+# Chaves primárias — UUIDv7 (ordenado pelo tempo de criação)
+# ──────────────────────────────────────────────────────────────
+def uuid7() -> uuid.UUID:
+    """
+    Gera um UUID versão 7 (RFC 9562): 48 bits de timestamp em ms seguidos de
+    bits aleatórios. Como cresce com o tempo, novos jobs são inseridos no fim
+    do índice da PK em vez de em posições aleatórias (como no uuid4).
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10)) & ((1 << 80) - 1)
+    # Versão (4 bits) = 7 e variante (2 bits) = 0b10
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 # ──────────────────────────────────────────────────────────────
 # Base declarativa — todas as models herdam desta classe
 # ──────────────────────────────────────────────────────────────
@@ -49,16 +107,28 @@ class Base(DeclarativeBase):
 # Dependency Injection para FastAPI
 # ──────────────────────────────────────────────────────────────
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Fornece uma sessão de banco para cada requisição e garante fechamento."""
+    """
+    Fornece uma sessão de banco para cada requisição e garante fechamento.
+    Não há commit implícito: leituras não viram transações de escrita e
+    quem grava (ex.: JobService.create_job) confirma explicitamente.
+    """
     async with AsyncSessionFactory() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Fornece a fábrica de sessões para rotas que precisam de conexões extras
+    (ex.: consultas em paralelo). Separada de `get_db` para poder ser
+    substituída nos testes.
+    """
+    return AsyncSessionFactory
+
+
 # ──────────────────────────────────────────────────────────────
 # Criação de tabelas (usado no startup da aplicação)
 # ──────────────────────────────────────────────────────────────
@@ -40,10 +40,10 @@ class BaseCrawler(ABC):
         ...
 
     def _log_start(self) -> None:
-        self.logger.info("Iniciando crawling: %s", self.source_name)
+        self.logger.debug("Iniciando crawling: %s", self.source_name)
 
     def _log_done(self, count: int) -> None:
-        self.logger.info(
+        self.logger.debug(
             "Crawling concluído: %s — %d registros coletados",
             self.source_name,
             count,
@@ -2,12 +2,12 @@
 HockeyCrawler — coleta dados da tabela de times de hockey com paginação HTML.
 
 Fonte: https://www.scrapethissite.com/pages/forms/
-Estratégia: requests + BeautifulSoup (página HTML estática com paginação)
+Estratégia: httpx assíncrono + BeautifulSoup/lxml (página HTML estática com paginação)
 
 Etapas do crawling:
   1. Buscar página inicial para descobrir total de páginas
-  2. Iterar por todas as páginas usando ?page_num=X
-  3. Parsear a tabela HTML e extrair cada linha
+  2. Buscar as páginas restantes (?page_num=X) em paralelo
+  3. Parsear a tabela HTML de cada página assim que ela chega
   4. Normalizar e retornar lista de dicts
 """
 
@@ -15,17 +15,27 @@ import asyncio
 from typing import Any
 
 import httpx
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from app.crawlers.base import BaseCrawler
+from app.crawlers.http_client import get_http_client
 
 BASE_URL = "https://www.scrapethissite.com/pages/forms/"
 
+# Limite de requisições simultâneas às páginas do site
+MAX_CONCURRENT_PAGES = 8
+
+# Seletores CSS compilados uma única vez e reutilizados em todas as páginas
+_PAGE_LINK_SEL = sv.compile("ul.pagination li.page-item a.page-link")
+_TEAM_ROW_SEL = sv.compile("table.table tbody tr.team")
+
 
 class HockeyCrawler(BaseCrawler):
     """
-    Crawler para times de hockey usando requests síncrono
-    executado em thread pool para não bloquear o event loop.
+    Crawler para times de hockey usando httpx assíncrono.
+    As páginas 2..N são buscadas concorrentemente, limitadas por semáforo,
+    sobre o cliente HTTP/2 compartilhado (conexão reaproveitada entre jobs).
     """
 
     def __init__(self) -> None:
@@ -39,8 +49,7 @@ class HockeyCrawler(BaseCrawler):
         """Executa o scraping completo de todos os times de hockey."""
         self._log_start()
         try:
-            # Executa a parte síncrona (requests/BS4) em thread pool
-            records = await asyncio.get_event_loop().run_in_executor(None, self._fetch_all_pages)
+            records = await self._fetch_all_pages_async()
             self._log_done(len(records))
             return records
         except Exception as exc:
@@ -48,35 +57,58 @@ class HockeyCrawler(BaseCrawler):
             raise
 
     # ──────────────────────────────────────────
-    # Lógica síncrona de scraping
+    # Lógica assíncrona de scraping
     # ──────────────────────────────────────────
-    def _fetch_all_pages(self) -> list[dict[str, Any]]:
+    async def _fetch_all_pages_async(self) -> list[dict[str, Any]]:
         """
         Percorre todas as páginas do site e agrega os registros.
-        Detecta o total de páginas na primeira requisição.
+        Detecta o total de páginas na primeira requisição e busca as demais
+        em paralelo, preservando a ordem das páginas no resultado.
         """
         records: list[dict[str, Any]] = []
+        client = get_http_client()
+
+        # Etapa 1: buscar página 1 e detectar total de páginas
+        first_page_html = await self._get_page(client, page_num=1)
+        first_soup = BeautifulSoup(first_page_html, "lxml")
+        total_pages = self._get_total_pages(first_soup)
 
-        with httpx.Client(timeout=30.0) as client:
-            # Etapa 1: buscar página 1 e detectar total de páginas
-            first_page_html = self._get_page(client, page_num=1)
-            first_soup = BeautifulSoup(first_page_html, "html.parser")
-            total_pages = self._get_total_pages(first_soup)
+        # Etapa 2: parsear página 1
+        records.extend(self._parse_table(first_soup))
 
-            # Etapa 2: parsear página 1
-            records.extend(self._parse_table(first_soup))
+        # Etapa 3: buscar e parsear as páginas restantes concorrentemente
+        sem = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        pages_records = await asyncio.gather(
+            *(
+                self._fetch_and_parse(sem, client, page_num)
+                for page_num in range(2, total_pages + 1)
+            )
+        )
 
-            # Etapa 3: iterar páginas restantes
-            for page_num in range(2, total_pages + 1):
-                html = self._get_page(client, page_num=page_num)
-                soup = BeautifulSoup(html, "html.parser")
-                records.extend(self._parse_table(soup))
+        for page_records in pages_records:
+            records.extend(page_records)
 
         return records
 
-    def _get_page(self, client: httpx.Client, page_num: int) -> str:
+    async def _fetch_and_parse(
+        self,
+        sem: asyncio.Semaphore,
+        client: httpx.AsyncClient,
+        page_num: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Busca uma página respeitando o limite de concorrência e já a parseia.
+        Cada página vira registros assim que chega: o parsing se sobrepõe às
+        requisições pendentes e o HTML/soup é liberado em seguida, em vez de
+        todas as páginas ficarem em memória até o fim do gather.
+        """
+        async with sem:
+            html = await self._get_page(client, page_num=page_num)
+        return self._parse_table(BeautifulSoup(html, "lxml"))
+
+    async def _get_page(self, client: httpx.AsyncClient, page_num: int) -> str:
         """Realiza a requisição HTTP para uma página específica."""
-        response = client.get(self.base_url, params={"page_num": page_num})
+        response = await client.get(self.base_url, params={"page_num": page_num})
         response.raise_for_status()
         return response.text
 
@@ -86,7 +118,7 @@ class HockeyCrawler(BaseCrawler):
         Retorna 1 como fallback se não encontrar paginação.
         """
         # A paginação usa links com classe 'page-link' contendo números
-        page_links = soup.select("ul.pagination li.page-item a.page-link")
+        page_links = _PAGE_LINK_SEL.select(soup)
         page_numbers: list[int] = []
 
         for link in page_links:
@@ -107,7 +139,7 @@ class HockeyCrawler(BaseCrawler):
           Team Name | Year | Wins | Losses | OT Losses | Win % | GF | GA | Diff
         """
         records: list[dict[str, Any]] = []
-        rows = soup.select("table.table tbody tr.team")
+        rows = _TEAM_ROW_SEL.select(soup)
 
         for row in rows:
             cells = row.find_all("td")
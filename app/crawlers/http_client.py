@@ -0,0 +1,42 @@
+"""
+Cliente HTTP compartilhado pelos crawlers.
+
+Um único httpx.AsyncClient (HTTP/2 + keep-alive) é criado no primeiro uso e
+reutilizado entre jobs, evitando pagar handshake TCP/TLS a cada crawl.
+O worker fecha o cliente no shutdown via `close_http_client()`.
+"""
+
+import httpx
+
+# Cabeçalhos enviados em todas as requisições dos crawlers
+DEFAULT_HEADERS = {"User-Agent": "scraper-rpa/1.0"}
+
+# Conexões mantidas abertas entre jobs (o HTTP/2 multiplexa as páginas)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Retorna o cliente compartilhado, criando-o na primeira chamada."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            headers=DEFAULT_HEADERS,
+            timeout=30.0,
+        )
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    """Fecha o cliente compartilhado (usado no shutdown do worker)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
@@ -2,20 +2,27 @@
 OscarCrawler — coleta dados de filmes vencedores do Oscar via JavaScript/AJAX.
 
 Fonte: https://www.scrapethissite.com/pages/ajax-javascript/
-Estratégia: Selenium para renderização da página + interação com botões de ano
-
-Etapas do crawling:
-  1. Inicializar o WebDriver (Chrome headless)
-  2. Acessar a URL alvo
-  3. Coletar todos os botões de ano disponíveis
-  4. Para cada ano: clicar no botão, aguardar AJAX carregar, parsear tabela
-  5. Fechar WebDriver
-  6. Retornar lista de dicts com os filmes
+Estratégia padrão: requisições HTTP diretas ao endpoint AJAX (JSON por ano)
+
+Etapas do crawling (AJAX):
+  1. Buscar a página alvo e extrair os anos disponíveis (links `a.year-link`)
+  2. Buscar `?ajax=true&year=YYYY` para todos os anos em paralelo
+  3. Normalizar o JSON de cada ano e retornar lista de dicts com os filmes
+
+Estratégia alternativa (OSCAR_USE_SELENIUM=true): Selenium com pool de drivers
+  1. Obter um WebDriver (Chrome headless) do pool de drivers pré-aquecidos
+  2. Acessar a URL alvo e clicar em cada botão de ano
+  3. Aguardar o AJAX carregar e parsear a tabela renderizada
+  4. Devolver o WebDriver ao pool (ou descartá-lo em caso de erro)
 """
 
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import soupsieve as sv
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -26,14 +33,89 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from app.core.config import settings
 from app.crawlers.base import BaseCrawler
+from app.crawlers.http_client import get_http_client
 
 TARGET_URL = "https://www.scrapethissite.com/pages/ajax-javascript/"
 
+# Seletor compilado dos links de ano da página (caminho AJAX)
+_YEAR_LINK_SEL = sv.compile("a.year-link")
+
+# Lê a tabela renderizada no próprio browser e devolve uma lista de dicts
+# ({title, nominations, awards, best_picture}); a célula Best Picture tem '*'
+# para o vencedor ou fica vazia.
+FILM_TABLE_SCRIPT = """
+const text = (row, sel) => {
+  const cell = row.querySelector(sel);
+  return cell ? cell.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll('table.table tbody tr.film')).map((row) => {
+  const title = text(row, 'td.film-title');
+  const nominations = text(row, 'td.film-nominations');
+  const awards = text(row, 'td.film-awards');
+  const bestPicture = text(row, 'td.film-best-picture');
+  if (title === null || nominations === null || awards === null || bestPicture === null) {
+    return null;
+  }
+  return {title, nominations, awards, best_picture: bestPicture.length > 0};
+});
+"""
+
+# ──────────────────────────────────────────────────────────────
+# Pool de WebDrivers reutilizados entre jobs
+# ──────────────────────────────────────────────────────────────
+# O Service (caminho do ChromeDriver) é resolvido uma única vez por processo;
+# drivers ociosos ficam em `_driver_pool` e `_driver_slots` limita quantos
+# drivers podem existir ao mesmo tempo.
+_SERVICE: Service | None = None
+_driver_pool: asyncio.Queue[webdriver.Chrome] | None = None
+_driver_slots: asyncio.Semaphore | None = None
+
+# Threads dedicadas às chamadas bloqueantes do Selenium (uma por driver do
+# pool), isoladas do executor padrão do event loop
+_SELENIUM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.selenium_pool_size,
+    thread_name_prefix="selenium",
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Executa uma chamada bloqueante do Selenium no executor dedicado."""
+    return await asyncio.get_running_loop().run_in_executor(_SELENIUM_EXECUTOR, func, *args)
+
+
+def _get_service() -> Service:
+    """Retorna o Service do ChromeDriver, instalando o binário na primeira chamada."""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = Service(ChromeDriverManager().install())
+    return _SERVICE
+
+
+def _get_pool() -> tuple[asyncio.Queue[webdriver.Chrome], asyncio.Semaphore]:
+    """Cria o pool de drivers de forma preguiçosa (dentro do event loop)."""
+    global _driver_pool, _driver_slots
+    if _driver_pool is None or _driver_slots is None:
+        _driver_pool = asyncio.Queue()
+        _driver_slots = asyncio.Semaphore(settings.selenium_pool_size)
+    return _driver_pool, _driver_slots
+
+
+async def close_driver_pool() -> None:
+    """Encerra todos os drivers ociosos do pool (usado no shutdown do worker)."""
+    if _driver_pool is None:
+        return
+    while not _driver_pool.empty():
+        driver = _driver_pool.get_nowait()
+        await _run_blocking(driver.quit)
+
 
 class OscarCrawler(BaseCrawler):
     """
-    Crawler para filmes do Oscar usando Selenium para páginas com AJAX.
-    O WebDriver é criado e destruído a cada execução do método crawl().
+    Crawler para filmes do Oscar.
+
+    Por padrão consulta diretamente o endpoint JSON usado pelo AJAX da página,
+    sem renderizar o site. O caminho com Selenium é mantido como alternativa;
+    nele o WebDriver é emprestado do pool de módulo e devolvido ao final.
     """
 
     def __init__(self) -> None:
@@ -45,10 +127,13 @@ class OscarCrawler(BaseCrawler):
     # Método principal (interface do BaseCrawler)
     # ──────────────────────────────────────────
     async def crawl(self) -> list[dict[str, Any]]:
-        """Executa o scraping via Selenium em thread pool."""
+        """Executa o scraping pela estratégia configurada (AJAX ou Selenium)."""
+        if settings.oscar_use_selenium:
+            return await self._crawl_selenium()
+
         self._log_start()
         try:
-            records = await asyncio.get_event_loop().run_in_executor(None, self._run_selenium)
+            records = await self._crawl_ajax()
             self._log_done(len(records))
             return records
         except Exception as exc:
@@ -56,40 +141,123 @@ class OscarCrawler(BaseCrawler):
             raise
 
     # ──────────────────────────────────────────
-    # Lógica síncrona com Selenium
+    # Lógica assíncrona via endpoint AJAX
     # ──────────────────────────────────────────
-    def _run_selenium(self) -> list[dict[str, Any]]:
+    async def _crawl_ajax(self) -> list[dict[str, Any]]:
+        """
+        Descobre os anos disponíveis e busca o JSON de cada ano em paralelo,
+        preservando a ordem dos anos no resultado.
+        """
+        records: list[dict[str, Any]] = []
+
+        client = get_http_client()
+
+        # Etapa 1: descobrir os anos a partir dos links da página
+        response = await client.get(self.target_url, timeout=self.timeout)
+        response.raise_for_status()
+        years = self._parse_years(BeautifulSoup(response.text, "lxml"))
+
+        # Etapa 2: buscar o JSON de todos os anos concorrentemente
+        responses = await asyncio.gather(
+            *(
+                client.get(
+                    self.target_url, params={"ajax": "true", "year": y}, timeout=self.timeout
+                )
+                for y in years
+            )
+        )
+
+        # Etapa 3: normalizar os filmes de cada ano
+        for year, year_response in zip(years, responses, strict=True):
+            year_response.raise_for_status()
+            records.extend(self._parse_year_payload(year_response.json(), year))
+
+        return records
+
+    @staticmethod
+    def _parse_years(soup: BeautifulSoup) -> list[int]:
+        """Extrai os anos disponíveis a partir dos links `a.year-link`."""
+        years: list[int] = []
+        for link in _YEAR_LINK_SEL.select(soup):
+            text = link.get_text(strip=True)
+            if text.isdigit():
+                years.append(int(text))
+        return years
+
+    def _parse_year_payload(self, payload: list[dict[str, Any]], year: int) -> list[dict[str, Any]]:
         """
-        Abre o browser, navega pelo site e coleta todos os filmes por ano.
-        Garante que o WebDriver seja fechado ao final (com ou sem erro).
+        Normaliza os filmes retornados pelo endpoint AJAX de um ano.
+
+        Formato esperado de cada item:
+          {"title": ..., "nominations": ..., "awards": ..., "best_picture": true?}
+        O campo best_picture só é enviado para o vencedor de Melhor Filme.
         """
-        driver = self._create_driver()
         records: list[dict[str, Any]] = []
 
+        for item in payload:
+            try:
+                records.append(
+                    {
+                        "year": year,
+                        "title": str(item["title"]).strip(),
+                        "nominations": int(item["nominations"]),
+                        "awards": int(item["awards"]),
+                        "best_picture": bool(item.get("best_picture", False)),
+                    }
+                )
+            except (KeyError, TypeError, ValueError) as exc:
+                self.logger.warning("Filme ignorado por erro de parsing: %s", exc)
+                continue
+
+        return records
+
+    # ──────────────────────────────────────────
+    # Estratégia alternativa com Selenium
+    # ──────────────────────────────────────────
+    async def _crawl_selenium(self) -> list[dict[str, Any]]:
+        """Executa o scraping via Selenium em thread pool."""
+        self._log_start()
+        driver = await self._acquire_driver()
         try:
-            # Etapa 1: acessar a página principal
-            driver.get(self.target_url)
-            wait = WebDriverWait(driver, self.timeout)
+            records = await _run_blocking(self._run_selenium, driver)
+        except Exception as exc:
+            self._log_error(exc)
+            await self._release_driver(driver, healthy=False)
+            raise
 
-            # Etapa 2: aguardar os botões de ano aparecerem
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.year-link")))
+        await self._release_driver(driver, healthy=True)
+        self._log_done(len(records))
+        return records
 
-            # Etapa 3: coletar todos os anos disponíveis (texto dos botões)
-            year_buttons = driver.find_elements(By.CSS_SELECTOR, "a.year-link")
-            years = [btn.text.strip() for btn in year_buttons if btn.text.strip()]
+    # ──────────────────────────────────────────
+    # Lógica síncrona com Selenium
+    # ──────────────────────────────────────────
+    def _run_selenium(self, driver: webdriver.Chrome) -> list[dict[str, Any]]:
+        """
+        Navega pelo site com o driver recebido e coleta todos os filmes por ano.
+        O ciclo de vida do driver é responsabilidade do pool (ver crawl()).
+        """
+        records: list[dict[str, Any]] = []
 
-            # Etapa 4: para cada ano, clicar e extrair os filmes
-            for year_text in years:
-                try:
-                    year_records = self._scrape_year(driver, wait, year_text)
-                    records.extend(year_records)
-                except Exception as exc:
-                    self.logger.warning("Erro ao processar ano %s: %s", year_text, exc)
-                    continue
+        # Etapa 1: acessar a página principal
+        driver.get(self.target_url)
+        wait = WebDriverWait(driver, self.timeout)
 
-        finally:
-            # Etapa 5: sempre fechar o browser
-            driver.quit()
+        # Etapa 2: aguardar os botões de ano aparecerem
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.year-link")))
+
+        # Etapa 3: coletar todos os anos disponíveis (texto dos botões)
+        year_buttons = driver.find_elements(By.CSS_SELECTOR, "a.year-link")
+        years = [btn.text.strip() for btn in year_buttons if btn.text.strip()]
+
+        # Etapa 4: para cada ano, clicar e extrair os filmes
+        for year_text in years:
+            try:
+                year_records = self._scrape_year(driver, wait, year_text)
+                records.extend(year_records)
+            except Exception as exc:
+                self.logger.warning("Erro ao processar ano %s: %s", year_text, exc)
+                continue
 
         return records
 
@@ -121,44 +289,78 @@ class OscarCrawler(BaseCrawler):
 
         Colunas esperadas:
           Title | Nominations | Awards | Best Picture
+
+        A tabela inteira é lida por um único `execute_script` (uma ida ao
+        browser em vez de 4 `find_element` por linha). Linhas sem alguma das
+        células chegam como null e são ignoradas.
         """
-        records: list[dict[str, Any]] = []
-        rows = driver.find_elements(By.CSS_SELECTOR, "table.table tbody tr.film")
+        rows: list[dict[str, Any] | None] = driver.execute_script(FILM_TABLE_SCRIPT) or []
 
+        valid_rows: list[dict[str, Any]] = []
         for row in rows:
-            try:
-                title = row.find_element(By.CSS_SELECTOR, "td.film-title").text.strip()
-                nominations = int(
-                    row.find_element(By.CSS_SELECTOR, "td.film-nominations").text.strip()
-                )
-                awards = int(row.find_element(By.CSS_SELECTOR, "td.film-awards").text.strip())
-                # Best Picture: célula tem classe 'film-best-picture' com '*' ou vazio
-                best_picture_cell = row.find_element(By.CSS_SELECTOR, "td.film-best-picture")
-                best_picture = bool(best_picture_cell.text.strip())
-
-                records.append(
-                    {
-                        "year": year,
-                        "title": title,
-                        "nominations": nominations,
-                        "awards": awards,
-                        "best_picture": best_picture,
-                    }
-                )
-            except Exception as exc:
-                self.logger.warning("Linha de filme ignorada: %s", exc)
+            if row is None:
+                self.logger.warning("Linha de filme ignorada: células ausentes")
                 continue
+            valid_rows.append(row)
 
-        return records
+        # Mesmo formato do endpoint AJAX: reaproveita a normalização
+        return self._parse_year_payload(valid_rows, year)
+
+    # ──────────────────────────────────────────
+    # Pool de WebDrivers
+    # ──────────────────────────────────────────
+    @classmethod
+    async def _acquire_driver(cls) -> webdriver.Chrome:
+        """
+        Empresta um driver ocioso do pool ou cria um novo se houver vaga.
+        Aguarda a liberação de um driver quando o pool está no limite.
+        """
+        pool, slots = _get_pool()
+        await slots.acquire()
+        try:
+            return pool.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        try:
+            return await _run_blocking(cls._create_driver)
+        except Exception:
+            slots.release()
+            raise
+
+    @classmethod
+    async def _release_driver(cls, driver: webdriver.Chrome, healthy: bool) -> None:
+        """
+        Devolve o driver ao pool após limpar o estado da sessão.
+        Drivers com erro são encerrados; o pool recria outro sob demanda.
+        """
+        pool, slots = _get_pool()
+        try:
+            if healthy:
+                try:
+                    await _run_blocking(cls._reset_driver, driver)
+                    pool.put_nowait(driver)
+                    return
+                except Exception:
+                    pass
+            await _run_blocking(driver.quit)
+        finally:
+            slots.release()
+
+    @staticmethod
+    def _reset_driver(driver: webdriver.Chrome) -> None:
+        """Limpa cookies e navega para uma página vazia antes da reutilização."""
+        driver.delete_all_cookies()
+        driver.get("about:blank")
 
     # ──────────────────────────────────────────
     # Configuração do WebDriver
     # ──────────────────────────────────────────
-    def _create_driver(self) -> webdriver.Chrome:
+    @staticmethod
+    def _create_driver() -> webdriver.Chrome:
         """
         Cria instância do Chrome WebDriver com configurações headless.
-        Usa webdriver-manager para gerenciar o binário do ChromeDriver
-        automaticamente.
+        Usa o Service compartilhado do módulo (webdriver-manager resolvido uma vez).
         """
         chrome_options = Options()
 
@@ -171,5 +373,4 @@ class OscarCrawler(BaseCrawler):
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
 
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
+        return webdriver.Chrome(service=_get_service(), options=chrome_options)
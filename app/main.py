@@ -4,10 +4,12 @@ Ponto de entrada da aplicação FastAPI.
 Etapas do startup:
   1. Criar tabelas no PostgreSQL (se não existirem)
   2. Conectar o QueuePublisher ao RabbitMQ
-  3. Registrar os roteadores da API
+  3. Conectar o cache de respostas ao Redis
+  4. Registrar os roteadores da API
 
 Etapas do shutdown:
   1. Desconectar o QueuePublisher
+  2. Desconectar o cache de respostas
 """
 
 import logging
@@ -15,14 +17,16 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import crawl, jobs, results
 from app.core.config import settings
 from app.core.database import create_tables
+from app.services.cache_service import response_cache
 from app.services.queue_service import queue_publisher
 
 logging.basicConfig(
-    level=logging.DEBUG if settings.debug else logging.INFO,
+    level=logging.DEBUG if settings.debug else settings.log_level.upper(),
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 logger = logging.getLogger(__name__)
@@ -37,18 +41,23 @@ async def lifespan(app: FastAPI):
     logger.info("Iniciando aplicação: %s", settings.app_name)
 
     # Etapa 1: criar tabelas no banco
-    await create_tables()
-    logger.info("Tabelas do banco verificadas/criadas.")
+    if settings.db_auto_create_tables:
+        await create_tables()
+        logger.info("Tabelas do banco verificadas/criadas.")
 
     # Etapa 2: conectar ao RabbitMQ
     await queue_publisher.connect()
     logger.info("Conectado ao RabbitMQ.")
 
+    # Etapa 3: conectar o cache de respostas (opcional)
+    await response_cache.connect()
+
     yield  # aplicação em execução
 
     # ── Shutdown ──
     logger.info("Encerrando aplicação...")
     await queue_publisher.disconnect()
+    await response_cache.disconnect()
 
 
 # ──────────────────────────────────────────────────────────────
@@ -69,6 +78,9 @@ app = FastAPI(
 # ──────────────────────────────────────────────────────────────
 # Middleware
 # ──────────────────────────────────────────────────────────────
+# Comprime respostas maiores que 1 KB (listagens de resultados)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
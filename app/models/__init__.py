@@ -2,5 +2,6 @@
 from app.models.hockey import HockeyTeam
 from app.models.job import Job
 from app.models.oscar import OscarFilm
+from app.models.result_version import ResultVersion
 
-__all__ = ["Job", "HockeyTeam", "OscarFilm"]
+__all__ = ["Job", "HockeyTeam", "OscarFilm", "ResultVersion"]
@@ -5,17 +5,22 @@ Fonte: https://www.scrapethissite.com/pages/forms/
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class HockeyTeam(Base):
     __tablename__ = "hockey_teams"
+    __table_args__ = (
+        # Resultados de um job em ordem de id (GET /jobs/{id}/results) direto
+        # do índice, sem sort; também atende o filtro simples por job_id
+        Index("ix_hockey_teams_job_id_id", "job_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -26,7 +31,6 @@ class HockeyTeam(Base):
         UUID(as_uuid=True),
         ForeignKey("jobs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # ──────────────────────────────────────────
@@ -47,7 +51,7 @@ class HockeyTeam(Base):
     # ──────────────────────────────────────────
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        default=utcnow,
     )
 
     def __repr__(self) -> str:
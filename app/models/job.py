@@ -7,41 +7,63 @@ Ciclo de vida do status:
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING
 
 from sqlalchemy import DateTime, Enum, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow, uuid7
 from app.schemas.job import JobStatus, JobType
 
+if TYPE_CHECKING:
+    from app.models.hockey import HockeyTeam
+    from app.models.oscar import OscarFilm
+
+
+def _enum_column(enum_cls: type[StrEnum], name: str) -> Enum:
+    """
+    VARCHAR com CHECK em vez de ENUM nativo do Postgres: novos valores não
+    exigem ALTER TYPE e o driver não precisa resolver o OID do tipo.
+    Grava o valor do enum ("pending"), não o nome do membro.
+    """
+    return Enum(
+        enum_cls,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        length=16,
+        values_callable=lambda members: [m.value for m in members],
+    )
+
 
 class Job(Base):
     __tablename__ = "jobs"
 
     # ──────────────────────────────────────────
-    # Chave primária: UUID gerado pelo Python
+    # Chave primária: UUIDv7 gerado pelo Python (ordenado pelo tempo)
     # ──────────────────────────────────────────
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     # ──────────────────────────────────────────
     # Tipo do job: hockey | oscar | all
     # ──────────────────────────────────────────
-    type: Mapped[str] = mapped_column(
-        Enum(JobType, name="job_type_enum"),
+    type: Mapped[JobType] = mapped_column(
+        _enum_column(JobType, "ck_jobs_type"),
         nullable=False,
     )
 
     # ──────────────────────────────────────────
     # Status: pending | running | completed | failed
     # ──────────────────────────────────────────
-    status: Mapped[str] = mapped_column(
-        Enum(JobStatus, name="job_status_enum"),
+    status: Mapped[JobStatus] = mapped_column(
+        _enum_column(JobStatus, "ck_jobs_status"),
         nullable=False,
         default=JobStatus.PENDING,
     )
@@ -57,12 +79,28 @@ class Job(Base):
     # ──────────────────────────────────────────
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        default=utcnow,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+    # ──────────────────────────────────────────
+    # Resultados coletados pelo job
+    # ──────────────────────────────────────────
+    # lazy="raise": nada é carregado sob demanda (evita N+1 acidental em
+    # código assíncrono); as rotas usam as consultas por job do JobService
+    hockey_results: Mapped[list["HockeyTeam"]] = relationship(
+        lazy="raise",
+        order_by="HockeyTeam.id",
+        passive_deletes=True,
+    )
+    oscar_results: Mapped[list["OscarFilm"]] = relationship(
+        lazy="raise",
+        order_by="OscarFilm.id",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
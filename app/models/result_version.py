@@ -0,0 +1,24 @@
+"""
+Model ResultVersion — contador de versão de cada tabela de resultados.
+
+Incrementado na mesma transação que grava (ou remove) resultados; as
+listagens globais usam o valor no ETag e na chave de cache.
+"""
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ResultVersion(Base):
+    __tablename__ = "result_versions"
+
+    # Nome da tabela de resultados (ex.: "hockey_teams")
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    # Sobe a cada commit que altera a tabela; nunca volta atrás
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ResultVersion {self.table_name} v{self.version}>"
@@ -35,4 +35,4 @@ class HockeyTeamResponse(HockeyTeamBase):
     job_id: uuid.UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -31,4 +31,4 @@ class OscarFilmResponse(OscarFilmBase):
     job_id: uuid.UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
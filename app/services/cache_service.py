@@ -0,0 +1,151 @@
+"""
+CacheService — cache de respostas JSON no Redis.
+
+Etapas do uso:
+  1. API: ao receber um GET cacheável, procura o payload já serializado no Redis
+  2. API: em caso de miss, consulta o banco, serializa e grava com TTL
+
+Não há invalidação: a chave das listagens de resultados inclui a versão da
+tabela, então um commit novo leva a chaves novas e as antigas expiram pelo TTL.
+
+Sem conexão ativa (ex.: testes, Redis indisponível) o cache é transparente:
+toda leitura é um miss e as gravações são ignoradas.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import cast
+
+from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Namespaces de cache usados pelas rotas
+RESULTS_NAMESPACE = "results"  # chave versionada pela tabela de resultados
+JOBS_NAMESPACE = "jobs"  # expira apenas por TTL curto
+
+
+class ResponseCache:
+    """
+    Armazena payloads JSON pré-serializados agrupados por namespace.
+    Instanciado no startup da API e reutilizado entre requisições.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+
+    # ──────────────────────────────────────────
+    # Ciclo de vida da conexão
+    # ──────────────────────────────────────────
+    async def connect(self) -> None:
+        """Abre o pool de conexões com o Redis (se o cache estiver habilitado)."""
+        if not settings.cache_enabled:
+            logger.info("Cache de respostas desabilitado.")
+            return
+
+        self._redis = Redis.from_url(settings.redis_url)
+        try:
+            await self._redis.ping()
+            logger.info("ResponseCache conectado ao Redis.")
+        except RedisError as exc:
+            logger.warning("Redis indisponível, cache desativado: %s", exc)
+            await self._redis.aclose()
+            self._redis = None
+
+    async def disconnect(self) -> None:
+        """Fecha o pool de conexões."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        logger.info("ResponseCache desconectado do Redis.")
+
+    # ──────────────────────────────────────────
+    # Leitura e escrita
+    # ──────────────────────────────────────────
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{settings.cache_prefix}:{namespace}:{key}"
+
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        """Retorna o payload em cache ou None (miss, Redis ausente ou com falha)."""
+        if self._redis is None:
+            return None
+
+        full_key = self._key(namespace, key)
+        try:
+            # Sem decode_responses o cliente devolve bytes (ou None no miss)
+            return cast(bytes | None, await self._redis.get(full_key))
+        except RedisError as exc:
+            logger.warning("Falha ao ler cache %s: %s", full_key, exc)
+            return None
+
+    async def set(self, namespace: str, key: str, payload: bytes, expire: int) -> None:
+        """Grava o payload com TTL; falhas do Redis são apenas registradas."""
+        if self._redis is None:
+            return
+
+        full_key = self._key(namespace, key)
+        try:
+            await self._redis.set(full_key, payload, ex=expire)
+        except RedisError as exc:
+            logger.warning("Falha ao gravar cache %s: %s", full_key, exc)
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        expire: int,
+        build: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """
+        Retorna o payload em cache ou executa `build()` e grava o resultado.
+        Falhas do Redis nunca interrompem a requisição — apenas viram miss.
+        """
+        cached = await self.get(namespace, key)
+        if cached is not None:
+            return cached
+
+        payload = await build()
+        await self.set(namespace, key, payload, expire)
+        return payload
+
+    async def stream_and_set(
+        self,
+        namespace: str,
+        key: str,
+        expire: int,
+        chunks: AsyncIterator[bytes],
+    ) -> AsyncIterator[bytes]:
+        """
+        Repassa os pedaços de uma resposta em streaming e grava o payload
+        completo no cache ao final. Sem Redis, apenas repassa (sem acumular).
+        """
+        if self._redis is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        buffer: list[bytes] = []
+        async for chunk in chunks:
+            buffer.append(chunk)
+            yield chunk
+        await self.set(namespace, key, b"".join(buffer), expire)
+
+
+def cache_key(request: Request, version: int | None = None) -> str:
+    """
+    Chave de cache de uma requisição: caminho + query string e, quando
+    informada, a versão dos dados. Com a versão na chave, um payload montado
+    a partir de dados antigos nunca é servido para uma versão mais nova.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    return key if version is None else f"{key}@{version}"
+
+
+# ──────────────────────────────────────────────────────────────
+# Singleton do cache — compartilhado pelas rotas da API
+# ──────────────────────────────────────────────────────────────
+response_cache = ResponseCache()
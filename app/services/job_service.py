@@ -4,20 +4,62 @@ JobService — camada de negócio para gerenciamento de Jobs.
 Responsabilidades:
   - Criar novos jobs no banco
   - Atualizar status (running, completed, failed)
+  - Persistir os resultados coletados
   - Consultar jobs e seus resultados
 """
 
+import functools
 import uuid
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from operator import itemgetter
+from typing import Any, cast
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import RowMapping, Table, delete, func, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.sql.schema import ScalarElementColumnDefault
 
+from app.core.database import utcnow
 from app.models.hockey import HockeyTeam
 from app.models.job import Job
 from app.models.oscar import OscarFilm
+from app.models.result_version import ResultVersion
 from app.schemas.job import JobStatus, JobType
 
+# Linhas por INSERT em lote ao persistir resultados
+BULK_INSERT_BATCH_SIZE = 1000
+
+# A partir deste volume os resultados são gravados com COPY (asyncpg);
+# abaixo dele o INSERT em lote tem custo fixo menor
+COPY_THRESHOLD = 500
+
+# Linhas buscadas por vez do cursor no servidor nas listagens em streaming
+STREAM_CHUNK_SIZE = 200
+
+
+@functools.cache
+def _copy_layout(table: Table) -> tuple[list[str], itemgetter, dict[str, Any]]:
+    """
+    Colunas do COPY de uma tabela de resultados, calculadas uma vez por tabela:
+    nomes (job_id e created_at primeiro), um itemgetter que monta a tupla de
+    cada registro de uma vez e os valores usados quando falta uma coluna.
+    """
+    fixed = ["job_id", "created_at"]
+    columns = [c for c in table.c if not c.primary_key and c.name not in fixed]
+    fill = {
+        c.name: c.default.arg if isinstance(c.default, ScalarElementColumnDefault) else None
+        for c in columns
+    }
+    return fixed + [c.name for c in columns], itemgetter(*fill), fill
+
+
+class JobNotFoundError(LookupError):
+    """O job informado não existe (ex.: removido antes de ser processado)."""
+
+    def __init__(self, job_id: uuid.UUID) -> None:
+        super().__init__(f"Job {job_id} não encontrado.")
+        self.job_id = job_id
+
 
 class JobService:
     """Encapsula todas as operações de banco relacionadas a Jobs."""
@@ -29,11 +71,16 @@ class JobService:
     # Criação de job
     # ──────────────────────────────────────────
     async def create_job(self, job_type: JobType) -> Job:
-        """Cria um novo job com status PENDING e retorna o objeto persistido."""
-        job = Job(type=job_type, status=JobStatus.PENDING)
-        self.db.add(job)
-        await self.db.flush()  # obtém o id gerado sem commitar ainda
-        await self.db.refresh(job)
+        """
+        Cria um novo job com status PENDING e confirma a transação, para que o
+        job já esteja visível quando o worker receber a mensagem da fila.
+        """
+        # INSERT ... RETURNING: uma ida ao banco, sem unit of work do ORM
+        result = await self.db.execute(
+            insert(Job).values(type=job_type, status=JobStatus.PENDING).returning(Job)
+        )
+        job = result.scalar_one()
+        await self.db.commit()
         return job
 
     # ──────────────────────────────────────────
@@ -44,61 +91,223 @@ class JobService:
         result = await self.db.execute(select(Job).where(Job.id == job_id))
         return result.scalar_one_or_none()
 
-    async def list_jobs(self) -> list[Job]:
-        """Retorna todos os jobs ordenados do mais recente ao mais antigo."""
-        result = await self.db.execute(select(Job).order_by(Job.created_at.desc()))
-        return list(result.scalars().all())
+    async def list_jobs(self) -> list[RowMapping]:
+        """
+        Retorna todos os jobs ordenados do mais recente ao mais antigo.
+        As linhas vêm como mapeamentos de colunas (sem objetos ORM), prontas
+        para serializar direto em JSON.
+        """
+        result = await self.db.execute(select(*Job.__table__.c).order_by(Job.created_at.desc()))
+        return list(result.mappings().all())
 
     # ──────────────────────────────────────────
     # Atualização de status
     # ──────────────────────────────────────────
     async def mark_running(self, job_id: uuid.UUID) -> None:
         """Atualiza status para RUNNING quando o worker inicia o crawling."""
-        job = await self.get_job(job_id)
-        if job:
-            job.status = JobStatus.RUNNING
-            job.updated_at = datetime.now(UTC)
+        await self._update_job(job_id, status=JobStatus.RUNNING)
 
     async def mark_completed(self, job_id: uuid.UUID, items_collected: int) -> None:
         """Atualiza status para COMPLETED e registra quantos itens foram coletados."""
-        job = await self.get_job(job_id)
-        if job:
-            job.status = JobStatus.COMPLETED
-            job.items_collected = items_collected
-            job.updated_at = datetime.now(UTC)
+        await self._update_job(job_id, status=JobStatus.COMPLETED, items_collected=items_collected)
 
     async def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
         """Atualiza status para FAILED e salva a mensagem de erro."""
-        job = await self.get_job(job_id)
-        if job:
-            job.status = JobStatus.FAILED
-            job.error_message = error
-            job.updated_at = datetime.now(UTC)
+        await self._update_job(job_id, status=JobStatus.FAILED, error_message=error)
+
+    async def _update_job(self, job_id: uuid.UUID, **values: Any) -> None:
+        """
+        Aplica a transição com um único UPDATE ... RETURNING, sem SELECT
+        prévio nem objeto no identity map. O RETURNING também confirma a
+        existência do job: se nenhuma linha for alterada, lança JobNotFoundError.
+        updated_at usa o now() do servidor (horário da transação).
+        """
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(**values, updated_at=func.now())
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
+            raise JobNotFoundError(job_id)
 
     # ──────────────────────────────────────────
-    # Consulta de resultados por job
+    # Persistência de resultados (inserção em lote)
     # ──────────────────────────────────────────
-    async def get_hockey_results_by_job(self, job_id: uuid.UUID) -> list[HockeyTeam]:
-        """Retorna todos os times de hockey coletados por um job específico."""
-        result = await self.db.execute(select(HockeyTeam).where(HockeyTeam.job_id == job_id))
-        return list(result.scalars().all())
+    async def use_async_commit(self) -> None:
+        """
+        Desliga o fsync no commit da transação atual (SET LOCAL vale só até o
+        commit/rollback). Resultados e status são gravados — ou perdidos —
+        juntos, mas uma perda após o ACK deixa o job em RUNNING; por isso o
+        uso é opcional (settings.db_results_async_commit).
+        """
+        await self.db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+    async def add_hockey_results(self, job_id: uuid.UUID, records: list[dict[str, Any]]) -> int:
+        """Insere todos os times coletados com INSERTs em lote."""
+        return await self._bulk_insert(cast(Table, HockeyTeam.__table__), job_id, records)
+
+    async def add_oscar_results(self, job_id: uuid.UUID, records: list[dict[str, Any]]) -> int:
+        """Insere todos os filmes coletados com INSERTs em lote."""
+        return await self._bulk_insert(cast(Table, OscarFilm.__table__), job_id, records)
+
+    async def _bulk_insert(
+        self,
+        table: Table,
+        job_id: uuid.UUID,
+        records: list[dict[str, Any]],
+    ) -> int:
+        """
+        Substitui os resultados do job por `records` usando SQLAlchemy Core.
+
+        Linhas de uma tentativa anterior do mesmo job (mensagem reentregue
+        após o commit) são removidas antes, mantendo a persistência
+        idempotente. A inserção é um executemany em fatias de
+        BULK_INSERT_BATCH_SIZE, que o SQLAlchemy envia como poucos comandos
+        multi-VALUES, sem criar objetos ORM; lotes com COPY_THRESHOLD linhas
+        ou mais vão por COPY. Ao final incrementa a versão da tabela, na mesma
+        transação (ver get_results_version).
+        """
+        await self.db.execute(delete(table).where(table.c.job_id == job_id))
+
+        if len(records) >= COPY_THRESHOLD:
+            inserted = await self._copy_insert(table, job_id, records)
+        else:
+            rows = [{**record, "job_id": job_id} for record in records]
+            for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+                await self.db.execute(insert(table), rows[start : start + BULK_INSERT_BATCH_SIZE])
+            inserted = len(rows)
+
+        await self._bump_version(table)
+        return inserted
 
-    async def get_oscar_results_by_job(self, job_id: uuid.UUID) -> list[OscarFilm]:
-        """Retorna todos os filmes do Oscar coletados por um job específico."""
-        result = await self.db.execute(select(OscarFilm).where(OscarFilm.job_id == job_id))
-        return list(result.scalars().all())
+    async def _bump_version(self, table: Table) -> None:
+        """
+        Incrementa o contador de versão da tabela (upsert de uma linha). O
+        lock da linha serializa os commits que alteram a mesma tabela, então
+        cada um deles produz uma versão nova.
+        """
+        stmt = pg_insert(ResultVersion).values(table_name=table.name, version=1)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ResultVersion.table_name],
+                set_={"version": ResultVersion.version + 1},
+            )
+        )
+
+    async def _copy_insert(
+        self,
+        table: Table,
+        job_id: uuid.UUID,
+        records: list[dict[str, Any]],
+    ) -> int:
+        """
+        Grava os registros com COPY pela conexão asyncpg da própria sessão
+        (mesma transação do DELETE). O COPY ignora os defaults do ORM, então
+        job_id, created_at e os defaults escalares das colunas são preenchidos aqui.
+        """
+        names, pick, fill = _copy_layout(table)
+        created_at = utcnow()
+
+        rows: list[tuple[Any, ...]] = []
+        for record in records:
+            try:
+                values = pick(record)
+            except KeyError:  # coluna ausente no registro: usa default/NULL
+                values = pick(fill | record)
+            rows.append((job_id, created_at, *values))
+
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        if driver is None:  # conexão do pool já invalidada
+            raise RuntimeError("Conexão asyncpg indisponível para o COPY.")
+        await driver.copy_records_to_table(table.name, records=rows, columns=names)
+        return len(rows)
 
     # ──────────────────────────────────────────
-    # Consulta de todos os resultados
+    # Consulta de resultados por job
     # ──────────────────────────────────────────
-    async def get_all_hockey_results(self) -> list[HockeyTeam]:
-        """Retorna todos os dados de hockey coletados (todos os jobs)."""
+    async def get_hockey_results_by_job(self, job_id: uuid.UUID) -> list[RowMapping]:
+        """Retorna todos os times de hockey de um job como mapeamentos de colunas."""
+        return await self._results_by_job(HockeyTeam, job_id)
+
+    async def get_oscar_results_by_job(self, job_id: uuid.UUID) -> list[RowMapping]:
+        """Retorna todos os filmes do Oscar de um job como mapeamentos de colunas."""
+        return await self._results_by_job(OscarFilm, job_id)
+
+    async def _results_by_job(
+        self, model: type[HockeyTeam] | type[OscarFilm], job_id: uuid.UUID
+    ) -> list[RowMapping]:
+        """Consulta só as colunas (sem instâncias ORM nem identity map), ordenada por id."""
+        result = await self.db.execute(
+            select(*model.__table__.c).where(model.job_id == job_id).order_by(model.id)
+        )
+        return list(result.mappings().all())
+
+    async def count_hockey_results_by_job(self, job_id: uuid.UUID) -> int:
+        """Conta os times de hockey de um job sem carregar as linhas."""
+        return await self._count_by_job(HockeyTeam, job_id)
+
+    async def count_oscar_results_by_job(self, job_id: uuid.UUID) -> int:
+        """Conta os filmes do Oscar de um job sem carregar as linhas."""
+        return await self._count_by_job(OscarFilm, job_id)
+
+    async def _count_by_job(
+        self, model: type[HockeyTeam] | type[OscarFilm], job_id: uuid.UUID
+    ) -> int:
+        """
+        SELECT COUNT(*) filtrado por job_id, resolvido no índice (job_id, id).
+        Use no lugar de len(get_*_results_by_job(...)), que traz todas as linhas.
+        """
         result = await self.db.execute(
-            select(HockeyTeam).order_by(HockeyTeam.year, HockeyTeam.team_name)
+            select(func.count()).select_from(model).where(model.job_id == job_id)
+        )
+        return result.scalar_one()
+
+    # ──────────────────────────────────────────
+    # Consulta paginada de todos os resultados (keyset por id)
+    # ──────────────────────────────────────────
+    async def stream_hockey_page(
+        self, limit: int, cursor: int | None = None
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Gera uma página de times de hockey (todos os jobs) com id > cursor.
+        As linhas vêm de um cursor no servidor, como mapeamentos de colunas
+        (sem objetos ORM), e são consumidas enquanto a resposta é enviada.
+        """
+        async for row in self._stream_page(HockeyTeam, limit, cursor):
+            yield row
+
+    async def stream_oscar_page(
+        self, limit: int, cursor: int | None = None
+    ) -> AsyncIterator[RowMapping]:
+        """Gera uma página de filmes do Oscar (todos os jobs) com id > cursor."""
+        async for row in self._stream_page(OscarFilm, limit, cursor):
+            yield row
+
+    async def _stream_page(
+        self, model: type[HockeyTeam] | type[OscarFilm], limit: int, cursor: int | None
+    ) -> AsyncIterator[RowMapping]:
+        """Keyset por id: SELECT das colunas com id > cursor, lido em blocos do cursor."""
+        stmt = select(*model.__table__.c).order_by(model.id).limit(limit)
+        if cursor is not None:
+            stmt = stmt.where(model.id > cursor)
+        result: AsyncResult[Any] = await self.db.stream(
+            stmt.execution_options(yield_per=STREAM_CHUNK_SIZE)
         )
-        return list(result.scalars().all())
+        async for row in result.mappings():
+            yield row
 
-    async def get_all_oscar_results(self) -> list[OscarFilm]:
-        """Retorna todos os dados do Oscar coletados (todos os jobs)."""
-        result = await self.db.execute(select(OscarFilm).order_by(OscarFilm.year, OscarFilm.title))
-        return list(result.scalars().all())
+    async def get_results_version(self, model: type[HockeyTeam] | type[OscarFilm]) -> int:
+        """
+        Retorna a versão atual da tabela de resultados (0 se nunca foi escrita).
+        Diferente de max(id), muda em todo commit que altera a tabela — inclusive
+        quando linhas são removidas ou quando um commit com ids menores chega
+        depois de outro com ids maiores (jobs concorrentes).
+        """
+        result = await self.db.execute(
+            select(ResultVersion.version).where(ResultVersion.table_name == model.__tablename__)
+        )
+        return result.scalar_one_or_none() or 0
@@ -4,15 +4,23 @@ QueueService — integração com RabbitMQ usando aio-pika.
 Etapas da comunicação:
   1. Publisher (API): publica mensagem JSON na fila ao receber POST /crawl/*
   2. Consumer (Worker): consome mensagem, executa crawler e atualiza job
+
+As publicações da API passam por um buffer em memória: uma task de fundo
+agrupa as mensagens recebidas em uma janela curta e as publica em lote,
+aguardando as confirmações (publisher confirms) do lote em conjunto.
 """
 
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 import aio_pika
-from aio_pika import DeliveryMode, Message
-from aio_pika.abc import AbstractChannel, AbstractConnection
+import orjson
+from aio_pika import DeliveryMode, ExchangeType, Message
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange, AbstractQueue
 
 from app.core.config import settings
 from app.schemas.job import CrawlMessage
@@ -20,6 +28,36 @@ from app.schemas.job import CrawlMessage
 logger = logging.getLogger(__name__)
 
 
+# Modo de entrega das mensagens de agendamento (ver QUEUE_PERSISTENT_MESSAGES)
+_DELIVERY_MODE = (
+    DeliveryMode.PERSISTENT if settings.queue_persistent_messages else DeliveryMode.NOT_PERSISTENT
+)
+
+
+async def declare_crawl_queue(channel: AbstractChannel) -> AbstractQueue:
+    """
+    Declara a fila de crawling (idempotente) com os mesmos argumentos na API
+    e no Worker — o RabbitMQ recusa redeclarações com argumentos diferentes.
+    A fila é durável para sobreviver a reinicializações do broker.
+    """
+    arguments: dict[str, Any] = {}
+    if settings.queue_lazy:
+        arguments["x-queue-mode"] = "lazy"
+    if settings.queue_dead_letter_exchange:
+        await _declare_dead_letter(channel)
+        arguments["x-dead-letter-exchange"] = settings.queue_dead_letter_exchange
+    return await channel.declare_queue(settings.queue_name, durable=True, arguments=arguments)
+
+
+async def _declare_dead_letter(channel: AbstractChannel) -> None:
+    """Declara o exchange de dead-letter e a fila que guarda as mensagens rejeitadas."""
+    exchange = await channel.declare_exchange(
+        settings.queue_dead_letter_exchange, ExchangeType.FANOUT, durable=True
+    )
+    dead_queue = await channel.declare_queue(f"{settings.queue_name}.dead", durable=True)
+    await dead_queue.bind(exchange)
+
+
 class QueuePublisher:
     """
     Publica mensagens no RabbitMQ.
@@ -29,56 +67,137 @@ class QueuePublisher:
     def __init__(self) -> None:
         self._connection: AbstractConnection | None = None
         self._channel: AbstractChannel | None = None
+        self._exchange: AbstractExchange | None = None
+        self._outbox: asyncio.Queue[tuple[Message, asyncio.Future[None]]] | None = None
+        self._publish_task: asyncio.Task[None] | None = None
 
     # ──────────────────────────────────────────
     # Ciclo de vida da conexão
     # ──────────────────────────────────────────
     async def connect(self) -> None:
-        """Abre conexão e canal com o RabbitMQ."""
+        """
+        Abre conexão e canal com o RabbitMQ. O canal é reutilizado por todas
+        as publicações e a exchange padrão fica guardada para o loop de lote.
+        """
         self._connection = await aio_pika.connect_robust(settings.rabbitmq_url)
-        self._channel = await self._connection.channel()
-
-        # Declara a fila como durável para sobreviver a reinicializações
-        await self._channel.declare_queue(
-            settings.queue_name,
-            durable=True,
+        self._channel = await self._connection.channel(
+            publisher_confirms=settings.queue_publisher_confirms
         )
+        self._exchange = self._channel.default_exchange
+
+        await declare_crawl_queue(self._channel)
+        self._start_publish_loop()
         logger.info("QueuePublisher conectado ao RabbitMQ.")
 
     async def disconnect(self) -> None:
-        """Fecha conexão e canal."""
+        """Encerra a task de publicação e fecha conexão e canal."""
+        await self._stop_publish_loop()
         if self._connection and not self._connection.is_closed:
             await self._connection.close()
         logger.info("QueuePublisher desconectado do RabbitMQ.")
 
+    def _start_publish_loop(self) -> None:
+        """Cria o buffer de saída e inicia a task que publica em lote."""
+        self._outbox = asyncio.Queue()
+        self._publish_task = asyncio.create_task(self._publish_loop())
+
+    async def _stop_publish_loop(self) -> None:
+        """Cancela a task de publicação e falha as mensagens ainda pendentes."""
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._publish_task
+            self._publish_task = None
+
+        if self._outbox is not None:
+            while not self._outbox.empty():
+                _, future = self._outbox.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("QueuePublisher desconectado."))
+            self._outbox = None
+
     # ──────────────────────────────────────────
     # Publicação de mensagem
     # ──────────────────────────────────────────
     async def publish(self, message: CrawlMessage) -> None:
         """
-        Serializa CrawlMessage como JSON e publica na fila.
-        Usa DeliveryMode.PERSISTENT para garantir que a mensagem
-        não seja perdida em caso de reinicialização do broker.
+        Serializa CrawlMessage como JSON (orjson, sem passar pelo serializer do
+        Pydantic) e a entrega ao buffer de publicação.
+        Retorna somente após o broker confirmar o lote que contém a mensagem.
+        A mensagem só é persistente (gravada em disco pelo broker) com
+        QUEUE_PERSISTENT_MESSAGES=true; por padrão é transitória.
         """
-        if self._channel is None:
+        if self._exchange is None or self._outbox is None:
             raise RuntimeError("QueuePublisher não está conectado.")
 
-        body = message.model_dump_json().encode()
-
-        await self._channel.default_exchange.publish(
-            Message(
-                body=body,
-                delivery_mode=DeliveryMode.PERSISTENT,
-                content_type="application/json",
-            ),
-            routing_key=settings.queue_name,
+        # orjson trata UUID e Enum nativamente; o Worker valida com CrawlMessage
+        body = orjson.dumps({"job_id": message.job_id, "job_type": message.job_type})
+        amqp_message = Message(
+            body=body,
+            delivery_mode=_DELIVERY_MODE,
+            content_type="application/json",
         )
-        logger.info(
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._outbox.put((amqp_message, future))
+        await future
+
+        logger.debug(
             "Mensagem publicada: job_id=%s type=%s",
             message.job_id,
             message.job_type,
         )
 
+    async def _publish_loop(self) -> None:
+        """
+        Drena o buffer em lotes de até PUBLISH_BATCH_SIZE mensagens (ou o que
+        chegar dentro de PUBLISH_BATCH_WINDOW_MS) e publica o lote de uma vez.
+        As confirmações do lote são aguardadas juntas e repassadas a cada
+        chamador de publish() (com QUEUE_PUBLISHER_CONFIRMS=false, o publish
+        retorna assim que o frame é escrito no socket).
+        """
+        assert self._outbox is not None and self._exchange is not None
+        exchange = self._exchange
+        loop = asyncio.get_running_loop()
+        window = settings.publish_batch_window_ms / 1000
+
+        while True:
+            batch = [await self._outbox.get()]
+            deadline = loop.time() + window
+
+            while len(batch) < settings.publish_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._outbox.get(), remaining))
+                except TimeoutError:
+                    break
+
+            # mandatory=False: a fila já foi declarada em connect(), então o
+            # broker não precisa devolver mensagens sem rota
+            try:
+                results = await asyncio.gather(
+                    *(
+                        exchange.publish(msg, routing_key=settings.queue_name, mandatory=False)
+                        for msg, _ in batch
+                    ),
+                    return_exceptions=True,
+                )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("QueuePublisher desconectado."))
+                raise
+
+            for (_, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
+
 
 # ──────────────────────────────────────────────────────────────
 # Singleton do publisher — compartilhado pelo estado da aplicação
@@ -86,6 +205,14 @@ class QueuePublisher:
 queue_publisher = QueuePublisher()
 
 
+def get_queue_publisher() -> QueuePublisher:
+    """
+    Fornece o publisher às rotas via dependency injection, para que os
+    testes possam substituí-lo por um publisher em memória.
+    """
+    return queue_publisher
+
+
 # ──────────────────────────────────────────────────────────────
 # Context manager para o consumer (usado pelo Worker)
 # ──────────────────────────────────────────────────────────────
@@ -98,7 +225,8 @@ async def get_consumer_channel() -> AsyncGenerator[AbstractChannel, None]:
     connection = await aio_pika.connect_robust(settings.rabbitmq_url)
     try:
         channel = await connection.channel()
-        await channel.set_qos(prefetch_count=1)  # processa 1 mensagem por vez
+        # Limita as mensagens em voo para não inundar um worker lento
+        await channel.set_qos(prefetch_count=settings.rabbitmq_prefetch)
         yield channel
     finally:
         if not connection.is_closed:
@@ -0,0 +1,28 @@
+-- ──────────────────────────────────────────────────────────────
+-- jobs.type / jobs.status: ENUM nativo → VARCHAR(16) + CHECK
+--
+-- Bancos criados antes dessa mudança guardam as colunas nos tipos
+-- job_type_enum / job_status_enum, com o NOME do membro ('HOCKEY',
+-- 'PENDING'). O model atual grava o VALOR ('hockey', 'pending') em
+-- VARCHAR com CHECK, e o create_all do startup não altera tabelas
+-- existentes. Rodar uma única vez, com API e worker parados:
+--
+--   docker-compose exec -T postgres psql -U postgres -d scraper_db \
+--     < migrations/001_jobs_enum_to_varchar.sql
+-- ──────────────────────────────────────────────────────────────
+BEGIN;
+
+ALTER TABLE jobs
+    ALTER COLUMN type TYPE VARCHAR(16) USING lower(type::text),
+    ALTER COLUMN status TYPE VARCHAR(16) USING lower(status::text);
+
+ALTER TABLE jobs
+    ADD CONSTRAINT ck_jobs_type
+        CHECK (type IN ('hockey', 'oscar', 'all')),
+    ADD CONSTRAINT ck_jobs_status
+        CHECK (status IN ('pending', 'running', 'completed', 'failed'));
+
+DROP TYPE job_type_enum;
+DROP TYPE job_status_enum;
+
+COMMIT;
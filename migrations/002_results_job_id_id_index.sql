@@ -0,0 +1,23 @@
+-- ──────────────────────────────────────────────────────────────
+-- hockey_teams / oscar_films: índice (job_id) → (job_id, id)
+--
+-- Os models trocaram o index=True de job_id (ix_<tabela>_job_id) pelo
+-- índice composto ix_<tabela>_job_id_id, que entrega os resultados de um
+-- job já ordenados por id e também atende o filtro simples por job_id.
+-- O create_all do startup não altera tabelas existentes; em bancos
+-- criados antes dessa mudança, rodar uma única vez:
+--
+--   docker-compose exec -T postgres psql -U postgres -d scraper_db \
+--     < migrations/002_results_job_id_id_index.sql
+--
+-- CONCURRENTLY não bloqueia as escritas do worker, mas não roda dentro de
+-- transação: cada comando é executado isoladamente (sem BEGIN/COMMIT). Se
+-- um CREATE falhar, remova o índice INVALID que sobrar e rode de novo.
+-- ──────────────────────────────────────────────────────────────
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hockey_teams_job_id_id
+    ON hockey_teams (job_id, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_oscar_films_job_id_id
+    ON oscar_films (job_id, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_hockey_teams_job_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_oscar_films_job_id;
@@ -4,25 +4,26 @@ Fixtures globais de teste compartilhadas entre testes unitários e de integraç
 
 import asyncio
 import uuid
+from collections.abc import Callable
 
 import pytest
+import uvloop
 
 
 # ──────────────────────────────────────────────────────────────
 # Configuração do event loop para pytest-asyncio
 # ──────────────────────────────────────────────────────────────
-@pytest.fixture(scope="session")
-def event_loop():
-    """Cria um event loop único para toda a sessão de testes."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Roda os testes assíncronos no uvloop, o mesmo loop da API e do Worker."""
+    return {"uvloop": uvloop.new_event_loop}
 
 
 # ──────────────────────────────────────────────────────────────
 # Dados de exemplo para Hockey
 # ──────────────────────────────────────────────────────────────
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_hockey_html() -> str:
     """HTML de exemplo com estrutura da tabela de hockey."""
     return """
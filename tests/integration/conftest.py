@@ -3,139 +3,306 @@ Fixtures de integração usando Testcontainers.
 
 Etapas:
   1. Subir container PostgreSQL real para os testes
-  2. Subir container RabbitMQ real para os testes
-  3. Configurar engine e sessão SQLAlchemy apontando para o container
-  4. Criar tabelas antes de cada teste
-  5. Fornecer cliente HTTP para testar a API (TestClient do FastAPI)
+  2. Subir container RabbitMQ real (apenas para testes que usam a fila de fato)
+  3. Criar tabelas uma vez por suíte em um banco template e copiar dele o
+     banco de teste (engine e fábrica de sessões são únicos para a suíte)
+  4. Isolar cada teste em uma transação externa desfeita ao final (SAVEPOINT)
+  5. Fornecer cliente HTTP para testar a API (um por suíte; por teste só
+     troca a sessão de banco usada pela dependency `get_db`). As publicações
+     vão para um FakePublisher em memória — o RabbitMQ real só sobe para
+     testes que pedem `rabbitmq_publisher`.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 from collections.abc import AsyncGenerator
-from unittest.mock import AsyncMock
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, NamedTuple
 
+import asyncpg
+import docker
 import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
+from async_asgi_testclient import TestClient
+from docker.models.containers import Container
+from sqlalchemy import URL
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
+from testcontainers.core.config import testcontainers_config
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.docker_client import DockerClient
 from testcontainers.postgres import PostgresContainer
 from testcontainers.rabbitmq import RabbitMqContainer
 
-from app.core.database import Base, get_db
+from app.core.config import settings
+from app.core.database import Base, get_db, get_session_factory
 from app.main import app
-from app.services.queue_service import queue_publisher
+from app.schemas.job import CrawlMessage
+from app.services.queue_service import QueuePublisher, get_queue_publisher, queue_publisher
 
 logger = logging.getLogger(__name__)
 
+# SKIP_RABBIT=1: não sobe o RabbitMQ; testes que pedem `rabbitmq_publisher` são pulados
+SKIP_RABBIT = os.getenv("SKIP_RABBIT") == "1"
+
+# TC_REUSE=1: mantém os containers entre execuções do pytest (desenvolvimento
+# local). Sem Ryuk, nada remove os containers ao fim — a CI não deve usar.
+REUSE_CONTAINERS = os.getenv("TC_REUSE") == "1"
+REUSE_LABEL = "scraper-rpa-pytest"
+if REUSE_CONTAINERS:
+    testcontainers_config.ryuk_disabled = True
+
+# Worker do pytest-xdist ("gw0", "gw1", ...); "main" quando roda sem xdist.
+# Cada worker sobe seus próprios containers e usa nomes próprios de banco/fila.
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+
+# Identifica o checkout (hash do diretório raiz do repositório): execuções
+# simultâneas de clones diferentes na mesma máquina não compartilham recursos
+CHECKOUT_ID = hashlib.md5(
+    str(Path(__file__).resolve().parents[2]).encode(), usedforsecurity=False
+).hexdigest()[:8]
+
+# Banco modelo (schema criado uma vez) e banco recriado a partir dele por teste
+TEMPLATE_DB = f"app_template_{WORKER_ID}"
+TEST_DB = f"app_test_{WORKER_ID}"
+
+# Volume nomeado com o data dir do PostgreSQL (um por checkout e worker): a
+# imagem oficial só roda o initdb quando o diretório está vazio, então ele roda
+# uma única vez por checkout. Remova com `docker volume rm` para começar do zero.
+PG_DATA_VOLUME = f"scraper-rpa-pgdata-{CHECKOUT_ID}-{WORKER_ID}"
+
+# Um broker local responde em milissegundos; além disso, está fora do ar
+RABBIT_CONNECT_TIMEOUT = 1.0
+
 
 # ──────────────────────────────────────────────────────────────
 # Containers (escopo de sessão — sobem uma vez para todos os testes)
 # ──────────────────────────────────────────────────────────────
+class ReusedContainer:
+    """
+    Container de uma execução anterior (TC_REUSE=1), reconectado pela API
+    pública do Docker: host e portas vêm do container em execução; os demais
+    atributos (usuário, senha, ...) vêm da configuração do container de teste.
+    """
+
+    def __init__(self, config: DockerContainer, running: Container) -> None:
+        self._config = config
+        self._running = running
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._config, name)
+
+    def get_container_host_ip(self) -> str:
+        return DockerClient().host()
+
+    def get_exposed_port(self, port: int) -> int:
+        return int(self._running.ports[f"{port}/tcp"][0]["HostPort"])
+
+
+def _start_container(container: DockerContainer, name: str) -> DockerContainer | ReusedContainer:
+    """
+    Sobe o container. Com TC_REUSE=1, reaproveita o container de uma execução
+    anterior (localizado pelo label) ou sobe um novo já com o label.
+    """
+    if not REUSE_CONTAINERS:
+        return container.start()
+
+    label = f"{REUSE_LABEL}-{name}-{CHECKOUT_ID}-{WORKER_ID}"
+    running = docker.from_env().containers.list(filters={"label": f"{REUSE_LABEL}={label}"})
+    if running:
+        logger.info(f"♻️  Reaproveitando container {running[0].short_id} ({label})")
+        return ReusedContainer(container, running[0])
+    return container.with_kwargs(labels={REUSE_LABEL: label}).start()
+
+
+def _stop_container(container: DockerContainer | ReusedContainer) -> None:
+    """Para o container ao fim da suíte — exceto no modo de reuso."""
+    if not REUSE_CONTAINERS:
+        container.stop()
+
+
 @pytest.fixture(scope="session")
 def postgres_container():
     """Sobe container PostgreSQL para os testes de integração."""
     try:
         logger.info("Iniciando container PostgreSQL...")
-        with PostgresContainer("postgres:15-alpine") as pg:
-            logger.info(f"✅ PostgreSQL disponível em {pg.get_connection_url()}")
-            yield pg
+        pg = _start_container(
+            PostgresContainer("postgres:15-alpine").with_volume_mapping(
+                PG_DATA_VOLUME, "/var/lib/postgresql/data", "rw"
+            ),
+            "postgres",
+        )
     except Exception as e:
         logger.error(f"❌ Erro ao iniciar PostgreSQL: {e}")
         raise
 
+    logger.info(
+        f"✅ PostgreSQL disponível em {pg.get_container_host_ip()}:{pg.get_exposed_port(5432)}"
+    )
+    yield pg
+    _stop_container(pg)
+
+
+class DummyRabbitMqContainer:
+    """Substituto do container quando o RabbitMQ não está disponível."""
+
+    def get_container_host_ip(self):
+        return "localhost"
+
+    def get_exposed_port(self, port):
+        return port
+
 
 @pytest.fixture(scope="session")
 def rabbitmq_container():
     """Sobe container RabbitMQ para os testes de integração."""
+    if SKIP_RABBIT:
+        logger.info("SKIP_RABBIT=1 — RabbitMQ não será iniciado.")
+        yield DummyRabbitMqContainer()
+        return
+
     try:
         logger.info("Iniciando container RabbitMQ...")
-        with RabbitMqContainer("rabbitmq:3.12-management-alpine") as rmq:
-            logger.info(
-                f"✅ RabbitMQ disponível em "
-                f"{rmq.get_container_host_ip()}:{rmq.get_exposed_port(5672)}"
-            )
-            yield rmq
+        rmq = _start_container(RabbitMqContainer("rabbitmq:3.12-management-alpine"), "rabbitmq")
     except Exception as e:
         logger.error(f"❌ Erro ao iniciar RabbitMQ: {e}")
         logger.warning("RabbitMQ não disponível - testes usarão mock para queue_publisher")
 
         # Ainda assim retorna um objeto dummy para não quebrar a dependência
-        class DummyRabbitMqContainer:
-            def get_container_host_ip(self):
-                return "localhost"
-
-            def get_exposed_port(self, port):
-                return port
-
         yield DummyRabbitMqContainer()
+        return
+
+    logger.info(
+        f"✅ RabbitMQ disponível em {rmq.get_container_host_ip()}:{rmq.get_exposed_port(5672)}"
+    )
+    yield rmq
+    _stop_container(rmq)
 
 
 # ──────────────────────────────────────────────────────────────
 # Engine e sessão apontando para o container de teste
 # ──────────────────────────────────────────────────────────────
-@pytest.fixture(scope="session")
-def test_engine(postgres_container):
-    """Cria engine assíncrono para o banco de testes."""
-    url = postgres_container.get_connection_url().replace(
-        "postgresql+psycopg2", "postgresql+asyncpg"
+def _database_url(pg: PostgresContainer, database: str, driver: str) -> URL:
+    """URL do container apontando para outro banco do mesmo servidor."""
+    return URL.create(
+        driver,
+        username=pg.username,
+        password=pg.password,
+        host=pg.get_container_host_ip(),
+        port=int(pg.get_exposed_port(5432)),
+        database=database,
     )
-    engine = create_async_engine(url, echo=False)
-    return engine
 
 
-@pytest_asyncio.fixture(scope="session")
-async def setup_db(test_engine):
-    """Cria todas as tabelas no banco de testes."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+async def _admin_execute(pg: PostgresContainer, *statements: str) -> None:
+    """Executa DDL de banco (CREATE/DROP DATABASE) via asyncpg, fora de transação."""
+    dsn = _database_url(pg, "postgres", "postgresql").render_as_string(hide_password=False)
+    conn = await asyncpg.connect(dsn)
+    try:
+        for statement in statements:
+            await conn.execute(statement)
+    finally:
+        await conn.close()
 
 
-@pytest_asyncio.fixture
-async def db_session(test_engine, setup_db) -> AsyncGenerator[AsyncSession, None]:
-    """Sessão de banco isolada por teste (rollback ao final)."""
-    AsyncTestSession = async_sessionmaker(
-        bind=test_engine, class_=AsyncSession, expire_on_commit=False
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def template_db(postgres_container: PostgresContainer) -> None:
+    """
+    Cria TEMPLATE_DB (vazio) e as tabelas nele, uma única vez por worker.
+    Cada teste recebe uma cópia desse banco (CREATE DATABASE ... TEMPLATE),
+    sem rodar DDL de tabelas no caminho de cada teste.
+    """
+    await _admin_execute(
+        postgres_container,
+        f"DROP DATABASE IF EXISTS {TEMPLATE_DB} WITH (FORCE)",
+        f"CREATE DATABASE {TEMPLATE_DB}",
     )
-    async with AsyncTestSession() as session:
-        yield session
-        await session.rollback()
 
+    url = _database_url(postgres_container, TEMPLATE_DB, "postgresql+asyncpg")
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()  # o template não pode ter conexões abertas ao ser copiado
 
-# ──────────────────────────────────────────────────────────────
-# Cliente HTTP para testar a API FastAPI
-# ──────────────────────────────────────────────────────────────
-@pytest_asyncio.fixture
-async def api_client(
-    db_session: AsyncSession,
-    rabbitmq_container,
-) -> AsyncGenerator[AsyncClient, None]:
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine(
+    postgres_container: PostgresContainer, template_db: None
+) -> AsyncGenerator[AsyncEngine, None]:
     """
-    Cliente HTTP assíncrono que chama a API FastAPI em memória.
-    Substitui as dependências de DB e fila pelos containers de teste.
+    Recria TEST_DB a partir do template (uma vez por execução) e devolve o
+    engine único da suíte apontando para ele.
+    """
+    await _admin_execute(
+        postgres_container,
+        f"DROP DATABASE IF EXISTS {TEST_DB} WITH (FORCE)",
+        f"CREATE DATABASE {TEST_DB} TEMPLATE {TEMPLATE_DB}",
+    )
+    url = _database_url(postgres_container, TEST_DB, "postgresql+asyncpg")
+    # O container está sempre de pé durante a suíte: sem pre-ping (SELECT 1 a
+    # cada checkout) nem reciclagem; pool fixo, sem conexões de overflow
+    engine = create_async_engine(
+        url,
+        echo=False,
+        pool_pre_ping=False,
+        pool_size=20,
+        max_overflow=0,
+        pool_recycle=-1,
+    )
+    yield engine
+    await engine.dispose()
 
-    Se o RabbitMQ não estiver disponível, usa um mock para que os testes
-    de integração de API (sem publish/consume) ainda funcionem.
+
+@pytest.fixture(scope="session")
+def test_session_factory(test_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Fábrica de sessões única para toda a suíte (mesmas opções da aplicação)."""
+    return async_sessionmaker(
+        bind=test_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(
+    test_engine: AsyncEngine,
+    test_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
     """
+    Sessão de banco de um teste, presa a uma transação externa.
 
-    # Override do banco de dados
-    async def override_get_db():
-        yield db_session
+    A sessão usa uma conexão com transação aberta e
+    join_transaction_mode="create_savepoint": os commits feitos pela API
+    (que recebe esta mesma sessão via get_db) viram SAVEPOINTs, e o
+    rollback da transação externa ao final desfaz tudo o que o teste gravou.
 
-    # Override do publisher de fila com retry logic
-    app.dependency_overrides[get_db] = override_get_db
+    Sessões extras de get_session_factory (contagens em paralelo de jobs
+    ALL) usam outras conexões e não enxergam esses dados.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with test_session_factory(
+            bind=conn, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await transaction.rollback()
 
-    # Conectar publisher ao RabbitMQ do container com múltiplas tentativas
-    original_url = os.environ.get("RABBITMQ_URL", "")
-    rabbitmq_available = False
 
+# ──────────────────────────────────────────────────────────────
+# Cliente HTTP para testar a API FastAPI
+# ──────────────────────────────────────────────────────────────
+async def _connect_publisher(rabbitmq_container) -> bool:
+    """
+    Conecta o queue_publisher ao RabbitMQ do container (com fallbacks).
+    A URL vem de settings.rabbitmq_url (cached_property), sobrescrita no
+    __dict__ da instância a cada tentativa.
+    """
     # Tentar diferentes combinações de host/porta
     connection_attempts = [
         # Usar o IP e porta do container
@@ -146,38 +313,131 @@ async def api_client(
         "amqp://guest:guest@[::1]:5672/",
     ]
 
-    for rmq_url in connection_attempts:
-        os.environ["RABBITMQ_URL"] = rmq_url
+    for rmq_url in [] if SKIP_RABBIT else connection_attempts:
+        settings.__dict__["rabbitmq_url"] = rmq_url
         try:
-            await asyncio.wait_for(queue_publisher.connect(), timeout=5.0)
-            rabbitmq_available = True
+            await asyncio.wait_for(queue_publisher.connect(), timeout=RABBIT_CONNECT_TIMEOUT)
             logger.info("✅ Conectado ao RabbitMQ com sucesso")
-            break
+            return True
         except Exception as e:
             logger.debug(f"❌ Tentativa com {rmq_url} falhou: {e}")
-            continue
 
-    if not rabbitmq_available:
-        logger.warning(
-            "⚠️  RabbitMQ não disponível. Usando mock para queue_publisher. "
-            "Testes de API funcionarão, mas testes que dependem de pub/sub falharão."
-        )
-        # Mock do queue_publisher para que os testes de API funcionem
-        queue_publisher.publish = AsyncMock()
-        queue_publisher.consume = AsyncMock()
+    settings.__dict__.pop("rabbitmq_url", None)
+    return False
+
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def rabbitmq_publisher(rabbitmq_container) -> AsyncGenerator[QueuePublisher, None]:
+    """
+    Publisher real conectado ao RabbitMQ do container, para testes que
+    validam a fila de fato. Pula o teste se o broker não estiver disponível.
+    """
+    # Fila própria do worker do xdist, caso os workers caiam no mesmo broker
+    original_queue = settings.queue_name
+    settings.queue_name = f"{original_queue}_{WORKER_ID}"
+
+    if not await _connect_publisher(rabbitmq_container):
+        settings.queue_name = original_queue
+        pytest.skip("RabbitMQ não disponível.")
+
+    yield queue_publisher
 
-    # Cleanup
     try:
-        if rabbitmq_available:
-            await queue_publisher.disconnect()
+        await queue_publisher.disconnect()
     except Exception as e:
         logger.debug(f"Erro ao desconectar do RabbitMQ: {e}")
+    settings.__dict__.pop("rabbitmq_url", None)
+    settings.queue_name = original_queue
+
+
+class FakePublisher:
+    """Publisher em memória: guarda as mensagens em vez de enviá-las ao broker."""
+
+    def __init__(self) -> None:
+        self.messages: list[CrawlMessage] = []
+
+    async def publish(self, message: CrawlMessage) -> None:
+        self.messages.append(message)
+
+
+@pytest.fixture(scope="session")
+def fake_publisher() -> FakePublisher:
+    """Publisher em memória usado pela API nos testes de integração."""
+    return FakePublisher()
+
+
+# Sessão de banco do teste atual. O override de `get_db` é instalado uma vez
+# por suíte e lê daqui; cada teste só troca o valor.
+_current_db_session: ContextVar[AsyncSession] = ContextVar("current_db_session")
+
+
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    yield _current_db_session.get()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client(
+    test_session_factory: async_sessionmaker[AsyncSession],
+    fake_publisher: FakePublisher,
+) -> AsyncGenerator[TestClient, None]:
+    """
+    Cliente HTTP e overrides criados uma única vez para a suíte.
+    Os testes de API não dependem do transporte AMQP: as publicações vão
+    para o FakePublisher, sem subir RabbitMQ.
+    """
+    # Sessões extras (consultas em paralelo) também apontam para o container
+    app.dependency_overrides[get_session_factory] = lambda: test_session_factory
+    app.dependency_overrides[get_queue_publisher] = lambda: fake_publisher
+    app.dependency_overrides[get_db] = _override_get_db
+
+    # Sem `async with`: o lifespan (RabbitMQ/Redis/create_tables) não é executado
+    yield TestClient(app)
 
     app.dependency_overrides.clear()
-    if original_url:
-        os.environ["RABBITMQ_URL"] = original_url
-    elif "RABBITMQ_URL" in os.environ:
-        del os.environ["RABBITMQ_URL"]
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def api_client(
+    session_client: TestClient,
+    db_session: AsyncSession,
+    fake_publisher: FakePublisher,
+) -> TestClient:
+    """
+    Cliente HTTP assíncrono que chama a API FastAPI em memória.
+    Por teste, aponta `_current_db_session` para a sessão do teste (o
+    pytest-asyncio propaga o ContextVar do fixture para o teste) e esvazia
+    as mensagens capturadas pelo FakePublisher.
+    """
+    fake_publisher.messages.clear()
+    _current_db_session.set(db_session)
+    return session_client
+
+
+# ──────────────────────────────────────────────────────────────
+# Jobs criados uma vez por suíte (asserções só de leitura)
+# ──────────────────────────────────────────────────────────────
+class PostedJob(NamedTuple):
+    """Status HTTP e corpo já parseado de um POST /crawl/*."""
+
+    status_code: int
+    data: dict[str, Any]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def hockey_job(
+    session_client: TestClient,
+    test_session_factory: async_sessionmaker[AsyncSession],
+) -> PostedJob:
+    """
+    Executa POST /crawl/hockey uma única vez para a suíte. O job é gravado
+    (commit) no banco de teste, fora da transação de cada teste — por isso
+    fica visível para todos e os testes que o usam apenas leem.
+    """
+
+    async with test_session_factory() as session:
+        token = _current_db_session.set(session)
+        try:
+            response = await session_client.post("/crawl/hockey")
+        finally:
+            _current_db_session.reset(token)
+    return PostedJob(response.status_code, response.json())
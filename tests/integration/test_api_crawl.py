@@ -4,55 +4,42 @@ Testes de integração para os endpoints POST /crawl/*.
 Verifica que:
   - Os endpoints retornam 202 com job_id
   - O job é criado no banco com status PENDING
-  - A mensagem é publicada no RabbitMQ
+  - A mensagem é publicada na fila (capturada pelo FakePublisher)
 """
 
 import pytest
-from httpx import AsyncClient
+from async_asgi_testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.job import JobStatus, JobType
 from app.services.job_service import JobService
 
 
-@pytest.mark.asyncio
 class TestCrawlEndpoints:
     """Testes dos endpoints de agendamento de crawling."""
 
-    async def test_post_crawl_hockey_returns_202(self, api_client: AsyncClient) -> None:
+    async def test_post_crawl_hockey_returns_202(self, hockey_job) -> None:
         """POST /crawl/hockey deve retornar 202 com job_id."""
-        response = await api_client.post("/crawl/hockey")
-        assert response.status_code == 202
+        assert hockey_job.status_code == 202
 
-    async def test_post_crawl_hockey_returns_job_id(self, api_client: AsyncClient) -> None:
+    async def test_post_crawl_hockey_returns_job_id(self, hockey_job) -> None:
         """Resposta deve conter job_id no formato UUID."""
-        response = await api_client.post("/crawl/hockey")
-        data = response.json()
-        assert "job_id" in data
-        assert len(data["job_id"]) == 36  # UUID format
+        assert "job_id" in hockey_job.data
+        assert len(hockey_job.data["job_id"]) == 36  # UUID format
 
-    async def test_post_crawl_hockey_status_pending(self, api_client: AsyncClient) -> None:
+    async def test_post_crawl_hockey_status_pending(self, hockey_job) -> None:
         """Job retornado deve ter status pending."""
-        response = await api_client.post("/crawl/hockey")
-        data = response.json()
-        assert data["status"] == JobStatus.PENDING.value
-
-    async def test_post_crawl_oscar_returns_202(self, api_client: AsyncClient) -> None:
-        """POST /crawl/oscar deve retornar 202."""
-        response = await api_client.post("/crawl/oscar")
-        assert response.status_code == 202
+        assert hockey_job.data["status"] == JobStatus.PENDING.value
 
-    async def test_post_crawl_all_returns_202(self, api_client: AsyncClient) -> None:
-        """POST /crawl/all deve retornar 202."""
-        response = await api_client.post("/crawl/all")
+    @pytest.mark.parametrize("endpoint", ["/crawl/oscar", "/crawl/all"])
+    async def test_post_crawl_returns_202(self, api_client: TestClient, endpoint: str) -> None:
+        """POST /crawl/oscar e /crawl/all devem retornar 202 (hockey: hockey_job)."""
+        response = await api_client.post(endpoint)
         assert response.status_code == 202
 
-    async def test_post_crawl_creates_job_in_db(
-        self, api_client: AsyncClient, db_session: AsyncSession
-    ) -> None:
+    async def test_post_crawl_creates_job_in_db(self, hockey_job, db_session: AsyncSession) -> None:
         """Job deve ser criado no banco de dados após a requisição."""
-        response = await api_client.post("/crawl/hockey")
-        job_id = response.json()["job_id"]
+        job_id = hockey_job.data["job_id"]
 
         import uuid
 
@@ -64,7 +51,7 @@ class TestCrawlEndpoints:
         assert job.type == JobType.HOCKEY
 
     async def test_post_crawl_all_creates_all_type_job(
-        self, api_client: AsyncClient, db_session: AsyncSession
+        self, api_client: TestClient, db_session: AsyncSession
     ) -> None:
         """Job criado por /crawl/all deve ter tipo 'all'."""
         response = await api_client.post("/crawl/all")
@@ -77,3 +64,15 @@ class TestCrawlEndpoints:
 
         assert job is not None
         assert job.type == JobType.ALL
+
+    async def test_post_crawl_publishes_message(
+        self, api_client: TestClient, fake_publisher
+    ) -> None:
+        """A mensagem publicada deve conter o job_id e o tipo do job."""
+        response = await api_client.post("/crawl/oscar")
+        job_id = response.json()["job_id"]
+
+        assert len(fake_publisher.messages) == 1
+        message = fake_publisher.messages[0]
+        assert str(message.job_id) == job_id
+        assert message.job_type == JobType.OSCAR
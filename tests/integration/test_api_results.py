@@ -4,53 +4,96 @@ Testes de integração para os endpoints de resultados.
 Verifica que:
   - GET /results/hockey retorna lista (mesmo vazia)
   - GET /results/oscar retorna lista (mesmo vazia)
+  - GET /results/* responde 304 quando o ETag enviado ainda é válido
+  - O ETag muda quando linhas mudam mesmo sem novo max(id)
   - GET /jobs/{job_id}/results retorna estrutura correta
+  - GET /jobs/{job_id}/results?count_only=true retorna só as contagens
+  - GET /jobs/{job_id}/results de um job ALL traz os blocos hockey e oscar
   - GET /jobs/{job_id}/results retorna 404 para job inexistente
 """
 
 import uuid
+from typing import Any
 
 import pytest
-from httpx import AsyncClient
+from async_asgi_testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.hockey import HockeyTeam
 from app.models.oscar import OscarFilm
 from app.schemas.job import JobType
+from app.services.job_service import JobService
+
+
+async def seed(
+    session: AsyncSession, model: type[HockeyTeam] | type[OscarFilm], rows: list[dict[str, Any]]
+) -> None:
+    """Insere os registros de teste com um único INSERT em lote (Core, sem objetos ORM)."""
+    await session.execute(insert(model), rows)
 
 
-@pytest.mark.asyncio
 class TestResultsEndpoints:
     """Testes dos endpoints de consulta de resultados."""
 
-    async def test_get_all_hockey_returns_200(self, api_client: AsyncClient) -> None:
-        """GET /results/hockey deve retornar 200."""
-        response = await api_client.get("/results/hockey")
+    @pytest.mark.parametrize("endpoint", ["/results/hockey", "/results/oscar"])
+    async def test_get_all_results_returns_list(
+        self, api_client: TestClient, endpoint: str
+    ) -> None:
+        """GET /results/* deve retornar 200 com uma lista."""
+        response = await api_client.get(endpoint)
         assert response.status_code == 200
-
-    async def test_get_all_hockey_returns_list(self, api_client: AsyncClient) -> None:
-        """Resposta de GET /results/hockey deve ser uma lista."""
-        response = await api_client.get("/results/hockey")
         assert isinstance(response.json(), list)
 
-    async def test_get_all_oscar_returns_200(self, api_client: AsyncClient) -> None:
-        """GET /results/oscar deve retornar 200."""
-        response = await api_client.get("/results/oscar")
-        assert response.status_code == 200
+    async def test_get_all_hockey_returns_304_for_current_etag(
+        self, api_client: TestClient
+    ) -> None:
+        """Reenviar o ETag atual em If-None-Match deve retornar 304 sem corpo."""
+        first = await api_client.get("/results/hockey")
+        etag = first.headers["etag"]
 
-    async def test_get_all_oscar_returns_list(self, api_client: AsyncClient) -> None:
-        """Resposta de GET /results/oscar deve ser uma lista."""
-        response = await api_client.get("/results/oscar")
-        assert isinstance(response.json(), list)
+        response = await api_client.get("/results/hockey", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    async def test_etag_changes_when_rows_change_without_new_ids(
+        self, api_client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Remover linhas abaixo do max(id) também deve gerar um novo ETag."""
+        service = JobService(db_session)
+        first_job = uuid.UUID((await api_client.post("/crawl/hockey")).json()["job_id"])
+        second_job = uuid.UUID((await api_client.post("/crawl/hockey")).json()["job_id"])
+        team = {
+            "team_name": "Etag Team",
+            "year": 2021,
+            "wins": 10,
+            "losses": 5,
+            "win_pct": 0.667,
+            "goals_for": 50,
+            "goals_against": 40,
+            "goal_diff": 10,
+        }
+        await service.add_hockey_results(first_job, [team])
+        await service.add_hockey_results(second_job, [team])
+        etag = (await api_client.get("/results/hockey")).headers["etag"]
+
+        # Reprocessar o primeiro job sem resultados só remove linhas: o max(id)
+        # continua sendo o do segundo job
+        await service.add_hockey_results(first_job, [])
+        response = await api_client.get("/results/hockey", headers={"If-None-Match": etag})
 
-    async def test_get_job_results_returns_404_for_unknown(self, api_client: AsyncClient) -> None:
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_get_job_results_returns_404_for_unknown(self, api_client: TestClient) -> None:
         """GET /jobs/{job_id}/results deve retornar 404 para job inexistente."""
         fake_id = uuid.uuid4()
         response = await api_client.get(f"/jobs/{fake_id}/results")
         assert response.status_code == 404
 
     async def test_get_job_results_hockey_structure(
-        self, api_client: AsyncClient, db_session: AsyncSession
+        self, api_client: TestClient, db_session: AsyncSession
     ) -> None:
         """GET /jobs/{job_id}/results para job de hockey deve ter campos esperados."""
         # Criar job de hockey
@@ -58,20 +101,24 @@ class TestResultsEndpoints:
         job_id = post_response.json()["job_id"]
 
         # Inserir dado de hockey manualmente no banco
-        hockey_record = HockeyTeam(
-            job_id=uuid.UUID(job_id),
-            team_name="Test Team",
-            year=2020,
-            wins=30,
-            losses=20,
-            ot_losses=5,
-            win_pct=0.6,
-            goals_for=200,
-            goals_against=180,
-            goal_diff=20,
+        await seed(
+            db_session,
+            HockeyTeam,
+            [
+                {
+                    "job_id": uuid.UUID(job_id),
+                    "team_name": "Test Team",
+                    "year": 2020,
+                    "wins": 30,
+                    "losses": 20,
+                    "ot_losses": 5,
+                    "win_pct": 0.6,
+                    "goals_for": 200,
+                    "goals_against": 180,
+                    "goal_diff": 20,
+                }
+            ],
         )
-        db_session.add(hockey_record)
-        await db_session.flush()
 
         response = await api_client.get(f"/jobs/{job_id}/results")
         data = response.json()
@@ -80,24 +127,30 @@ class TestResultsEndpoints:
         assert data["type"] == JobType.HOCKEY.value
         assert "data" in data
         assert data["count"] >= 1
+        # Contrato do schema: datetime UTC serializado pelo Pydantic com "Z"
+        assert data["data"][0]["created_at"].endswith("Z")
 
     async def test_get_job_results_oscar_structure(
-        self, api_client: AsyncClient, db_session: AsyncSession
+        self, api_client: TestClient, db_session: AsyncSession
     ) -> None:
         """GET /jobs/{job_id}/results para job de oscar deve ter campos esperados."""
         post_response = await api_client.post("/crawl/oscar")
         job_id = post_response.json()["job_id"]
 
-        oscar_record = OscarFilm(
-            job_id=uuid.UUID(job_id),
-            year=2010,
-            title="Test Film",
-            nominations=9,
-            awards=6,
-            best_picture=True,
+        await seed(
+            db_session,
+            OscarFilm,
+            [
+                {
+                    "job_id": uuid.UUID(job_id),
+                    "year": 2010,
+                    "title": "Test Film",
+                    "nominations": 9,
+                    "awards": 6,
+                    "best_picture": True,
+                }
+            ],
         )
-        db_session.add(oscar_record)
-        await db_session.flush()
 
         response = await api_client.get(f"/jobs/{job_id}/results")
         data = response.json()
@@ -106,27 +159,75 @@ class TestResultsEndpoints:
         assert data["type"] == JobType.OSCAR.value
         assert data["count"] >= 1
 
+    async def test_get_job_results_count_only_omits_data(
+        self, api_client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Com count_only=true, a resposta deve trazer só a contagem."""
+        post_response = await api_client.post("/crawl/oscar")
+        job_id = post_response.json()["job_id"]
+
+        await seed(
+            db_session,
+            OscarFilm,
+            [
+                {
+                    "job_id": uuid.UUID(job_id),
+                    "year": 2011,
+                    "title": "Count Film",
+                    "nominations": 4,
+                    "awards": 1,
+                    "best_picture": False,
+                }
+            ],
+        )
+
+        response = await api_client.get(
+            f"/jobs/{job_id}/results", query_string={"count_only": "true"}
+        )
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["count"] == 1
+        assert "data" not in data
+
+    async def test_get_job_results_all_has_both_sections(self, api_client: TestClient) -> None:
+        """Job ALL deve trazer os blocos hockey e oscar, cada um com count e data."""
+        post_response = await api_client.post("/crawl/all")
+        job_id = post_response.json()["job_id"]
+
+        response = await api_client.get(f"/jobs/{job_id}/results")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["type"] == JobType.ALL.value
+        assert data["hockey"] == {"count": 0, "data": []}
+        assert data["oscar"] == {"count": 0, "data": []}
+
     async def test_hockey_results_appear_in_global_list(
-        self, api_client: AsyncClient, db_session: AsyncSession
+        self, api_client: TestClient, db_session: AsyncSession
     ) -> None:
         """Dados de hockey inseridos devem aparecer em GET /results/hockey."""
         post_response = await api_client.post("/crawl/hockey")
         job_id = post_response.json()["job_id"]
 
-        record = HockeyTeam(
-            job_id=uuid.UUID(job_id),
-            team_name="Global Team",
-            year=2022,
-            wins=40,
-            losses=15,
-            ot_losses=None,
-            win_pct=0.727,
-            goals_for=220,
-            goals_against=170,
-            goal_diff=50,
+        await seed(
+            db_session,
+            HockeyTeam,
+            [
+                {
+                    "job_id": uuid.UUID(job_id),
+                    "team_name": "Global Team",
+                    "year": 2022,
+                    "wins": 40,
+                    "losses": 15,
+                    "ot_losses": None,
+                    "win_pct": 0.727,
+                    "goals_for": 220,
+                    "goals_against": 170,
+                    "goal_diff": 50,
+                }
+            ],
         )
-        db_session.add(record)
-        await db_session.flush()
 
         response = await api_client.get("/results/hockey")
         teams = response.json()
@@ -0,0 +1,95 @@
+"""
+Testes unitários do ResponseCache.
+
+Usa mock do cliente Redis para validar hit, miss e o modo transparente
+(sem conexão) sem precisar de um Redis real.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from redis.exceptions import RedisError
+
+from app.services.cache_service import ResponseCache, cache_key
+
+
+def make_cache(redis: MagicMock | None) -> ResponseCache:
+    """Cria um ResponseCache com o cliente Redis informado."""
+    cache = ResponseCache()
+    cache._redis = redis
+    return cache
+
+
+class TestResponseCache:
+    """Testes de leitura/escrita do cache de respostas."""
+
+    async def test_passthrough_when_not_connected(self) -> None:
+        """Sem Redis conectado, deve sempre executar build()."""
+        cache = make_cache(None)
+        build = AsyncMock(return_value=b"[]")
+
+        assert await cache.get_or_set("results", "/results/hockey?", 60, build) == b"[]"
+        build.assert_awaited_once()
+
+    async def test_hit_skips_build(self) -> None:
+        """Payload em cache deve ser retornado sem executar build()."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b"[1]")
+        cache = make_cache(redis)
+        build = AsyncMock()
+
+        assert await cache.get_or_set("results", "/results/hockey?", 60, build) == b"[1]"
+        build.assert_not_awaited()
+
+    async def test_miss_builds_and_stores(self) -> None:
+        """Em caso de miss, deve gravar o payload com o TTL informado."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+        redis.set = AsyncMock()
+        cache = make_cache(redis)
+
+        payload = await cache.get_or_set(
+            "results", "/results/oscar?", 60, AsyncMock(return_value=b"[]")
+        )
+
+        assert payload == b"[]"
+        redis.set.assert_awaited_once_with("scraper:results:/results/oscar?", b"[]", ex=60)
+
+    async def test_redis_error_falls_back_to_build(self) -> None:
+        """Erro do Redis não deve interromper a requisição."""
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=RedisError("down"))
+        redis.set = AsyncMock(side_effect=RedisError("down"))
+        cache = make_cache(redis)
+
+        payload = await cache.get_or_set("jobs", "/jobs?", 5, AsyncMock(return_value=b"[]"))
+
+        assert payload == b"[]"
+
+    async def test_stream_and_set_stores_full_payload(self) -> None:
+        """O stream deve repassar os pedaços e gravar o payload completo ao final."""
+        redis = MagicMock()
+        redis.set = AsyncMock()
+        cache = make_cache(redis)
+
+        async def source():
+            for chunk in (b"[", b"1", b"]"):
+                yield chunk
+
+        chunks = [c async for c in cache.stream_and_set("results", "k", 60, source())]
+
+        assert chunks == [b"[", b"1", b"]"]
+        redis.set.assert_awaited_once_with("scraper:results:k", b"[1]", ex=60)
+
+
+class TestCacheKey:
+    """Testes da chave de cache das requisições."""
+
+    def test_version_is_part_of_the_key(self) -> None:
+        """Versões diferentes dos dados devem gerar chaves diferentes."""
+        request = MagicMock()
+        request.url.path = "/results/hockey"
+        request.url.query = "limit=10"
+
+        assert cache_key(request) == "/results/hockey?limit=10"
+        assert cache_key(request, 3) == "/results/hockey?limit=10@3"
+        assert cache_key(request, 3) != cache_key(request, 4)
@@ -5,6 +5,8 @@ Testa a lógica de extração de dados da tabela HTML sem realizar
 chamadas reais à internet.
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from bs4 import BeautifulSoup
 
@@ -16,24 +18,49 @@ def crawler() -> HockeyCrawler:
     return HockeyCrawler()
 
 
+@pytest.fixture(scope="module")
+def sample_hockey_soup(sample_hockey_html: str) -> BeautifulSoup:
+    """HTML de exemplo parseado uma única vez para os testes do módulo (somente leitura)."""
+    return BeautifulSoup(sample_hockey_html, "lxml")
+
+
+PAGINATION_HTML = """
+<ul class="pagination">
+  <li class="page-item"><a class="page-link" href="?page_num=1">1</a></li>
+  <li class="page-item"><a class="page-link" href="?page_num=2">2</a></li>
+  <li class="page-item"><a class="page-link" href="?page_num=3">3</a></li>
+</ul>
+"""
+
+
+@pytest.fixture(scope="module")
+def paginated_soup() -> BeautifulSoup:
+    """Paginação com 3 páginas, parseada uma vez por módulo (somente leitura)."""
+    return BeautifulSoup(PAGINATION_HTML, "lxml")
+
+
+@pytest.fixture(scope="module")
+def empty_soup() -> BeautifulSoup:
+    """Documento sem paginação, parseado uma vez por módulo."""
+    return BeautifulSoup("<html></html>", "lxml")
+
+
+@pytest.fixture(scope="module")
+def parsed_hockey_records(sample_hockey_soup: BeautifulSoup) -> list[dict]:
+    """Registros extraídos do HTML de exemplo, calculados uma vez por módulo."""
+    return HockeyCrawler()._parse_table(sample_hockey_soup)
+
+
 class TestHockeyParser:
     """Testes para o método _parse_table do HockeyCrawler."""
 
-    def test_parse_table_returns_correct_count(
-        self, crawler: HockeyCrawler, sample_hockey_html: str
-    ) -> None:
+    def test_parse_table_returns_correct_count(self, parsed_hockey_records: list[dict]) -> None:
         """Deve retornar 2 registros para 2 linhas na tabela."""
-        soup = BeautifulSoup(sample_hockey_html, "html.parser")
-        records = crawler._parse_table(soup)
-        assert len(records) == 2
+        assert len(parsed_hockey_records) == 2
 
-    def test_parse_table_correct_fields(
-        self, crawler: HockeyCrawler, sample_hockey_html: str
-    ) -> None:
+    def test_parse_table_correct_fields(self, parsed_hockey_records: list[dict]) -> None:
         """Os campos do primeiro registro devem ser extraídos corretamente."""
-        soup = BeautifulSoup(sample_hockey_html, "html.parser")
-        records = crawler._parse_table(soup)
-        first = records[0]
+        first = parsed_hockey_records[0]
 
         assert first["team_name"] == "Boston Bruins"
         assert first["year"] == 2011
@@ -45,18 +72,14 @@ class TestHockeyParser:
         assert first["goals_against"] == 229
         assert first["goal_diff"] == 17
 
-    def test_parse_table_second_record(
-        self, crawler: HockeyCrawler, sample_hockey_html: str
-    ) -> None:
+    def test_parse_table_second_record(self, parsed_hockey_records: list[dict]) -> None:
         """O segundo registro deve ter goal_diff negativo."""
-        soup = BeautifulSoup(sample_hockey_html, "html.parser")
-        records = crawler._parse_table(soup)
-        assert records[1]["goal_diff"] == -14
+        assert parsed_hockey_records[1]["goal_diff"] == -14
 
     def test_parse_table_empty(self, crawler: HockeyCrawler) -> None:
         """Tabela sem linhas de time deve retornar lista vazia."""
         html = "<html><body><table class='table'><tbody></tbody></table></body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         records = crawler._parse_table(soup)
         assert records == []
 
@@ -71,7 +94,7 @@ class TestHockeyParser:
         </table>
         </body></html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         records = crawler._parse_table(soup)
         assert records == []
 
@@ -85,19 +108,39 @@ class TestHockeyParser:
         assert crawler._parse_int_or_none("42") == 42
         assert crawler._parse_int_or_none(" 7 ") == 7
 
-    def test_get_total_pages_extracts_max(self, crawler: HockeyCrawler) -> None:
+    def test_get_total_pages_extracts_max(
+        self, crawler: HockeyCrawler, paginated_soup: BeautifulSoup
+    ) -> None:
         """Deve retornar o maior número de página encontrado."""
-        html = """
-        <ul class="pagination">
-          <li class="page-item"><a class="page-link" href="?page_num=1">1</a></li>
-          <li class="page-item"><a class="page-link" href="?page_num=2">2</a></li>
-          <li class="page-item"><a class="page-link" href="?page_num=3">3</a></li>
-        </ul>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        assert crawler._get_total_pages(soup) == 3
+        assert crawler._get_total_pages(paginated_soup) == 3
 
-    def test_get_total_pages_fallback_to_one(self, crawler: HockeyCrawler) -> None:
+    def test_get_total_pages_fallback_to_one(
+        self, crawler: HockeyCrawler, empty_soup: BeautifulSoup
+    ) -> None:
         """Sem paginação deve retornar 1."""
-        soup = BeautifulSoup("<html></html>", "html.parser")
-        assert crawler._get_total_pages(soup) == 1
+        assert crawler._get_total_pages(empty_soup) == 1
+
+
+class TestHockeyCrawl:
+    """Testes do fluxo assíncrono de busca das páginas."""
+
+    async def test_crawl_fetches_all_pages_in_order(
+        self, crawler: HockeyCrawler, sample_hockey_html: str
+    ) -> None:
+        """Deve buscar todas as páginas e manter a ordem dos registros."""
+        first_page = sample_hockey_html.replace(
+            '<li class="page-item"><a class="page-link" href="?page_num=1">1</a></li>',
+            '<li class="page-item"><a class="page-link" href="?page_num=3">3</a></li>',
+        )
+        other_page = sample_hockey_html.replace("Boston Bruins", "Other Team")
+
+        async def fake_get_page(client, page_num: int) -> str:
+            return first_page if page_num == 1 else other_page
+
+        with patch.object(crawler, "_get_page", AsyncMock(side_effect=fake_get_page)) as get:
+            records = await crawler.crawl()
+
+        assert get.await_count == 3
+        assert len(records) == 6
+        assert records[0]["team_name"] == "Boston Bruins"
+        assert records[2]["team_name"] == "Other Team"
@@ -0,0 +1,29 @@
+"""
+Testes unitários do cliente HTTP compartilhado pelos crawlers.
+"""
+
+from app.crawlers import http_client
+
+
+class TestSharedHttpClient:
+    """Testes do ciclo de vida do httpx.AsyncClient compartilhado."""
+
+    async def test_client_is_reused_between_calls(self) -> None:
+        """Chamadas consecutivas devem devolver a mesma instância."""
+        client = http_client.get_http_client()
+        try:
+            assert http_client.get_http_client() is client
+        finally:
+            await http_client.close_http_client()
+
+    async def test_close_allows_new_client(self) -> None:
+        """Após fechar, a próxima chamada deve criar um cliente novo."""
+        client = http_client.get_http_client()
+        await http_client.close_http_client()
+
+        assert client.is_closed
+        new_client = http_client.get_http_client()
+        try:
+            assert new_client is not client
+        finally:
+            await http_client.close_http_client()
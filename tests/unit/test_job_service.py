@@ -5,15 +5,27 @@ Usa mock de AsyncSession para testar a lógica de negócio
 sem precisar de banco de dados real.
 """
 
+import time
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
+from app.core.database import uuid7
 from app.models.job import Job
 from app.schemas.job import JobStatus, JobType
-from app.services.job_service import JobService
+from app.services import job_service
+from app.services.job_service import (
+    BULK_INSERT_BATCH_SIZE,
+    COPY_THRESHOLD,
+    STREAM_CHUNK_SIZE,
+    JobNotFoundError,
+    JobService,
+)
 
 
 def make_mock_db() -> MagicMock:
@@ -22,64 +34,69 @@ def make_mock_db() -> MagicMock:
     db.add = MagicMock()
     db.flush = AsyncMock()
     db.refresh = AsyncMock()
-    db.execute = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock())
     db.commit = AsyncMock()
     return db
 
 
+# Timestamp fixo para os jobs de teste
+NOW = datetime.now(UTC)
+
+
 def make_mock_job(
-    job_id: uuid.UUID = None,
+    job_id: uuid.UUID | None = None,
     job_type: JobType = JobType.HOCKEY,
     status: JobStatus = JobStatus.PENDING,
-) -> Job:
-    """Cria um objeto Job com atributos preenchidos para testes."""
-    job = MagicMock(spec=Job)
-    job.id = job_id or uuid.uuid4()
-    job.type = job_type
-    job.status = status
-    job.items_collected = 0
-    job.error_message = None
-    job.created_at = datetime.now(UTC)
-    job.updated_at = datetime.now(UTC)
-    return job
+) -> SimpleNamespace:
+    """Cria um objeto com os atributos de um Job (sem MagicMock/spec) para testes."""
+    return SimpleNamespace(
+        id=job_id or uuid.uuid4(),
+        type=job_type,
+        status=status,
+        items_collected=0,
+        error_message=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
 
 
 class TestJobServiceCreate:
     """Testes de criação de job."""
 
-    @pytest.mark.asyncio
-    async def test_create_job_adds_to_db(self) -> None:
-        """create_job() deve chamar db.add() e retornar o job."""
+    async def test_create_job_inserts_and_commits(self) -> None:
+        """create_job() deve usar INSERT ... RETURNING, confirmar e retornar o job."""
         db = make_mock_db()
         job = make_mock_job()
-        db.refresh.side_effect = lambda j: None  # simula refresh sem banco
+        result_mock = MagicMock()
+        result_mock.scalar_one.return_value = job
+        db.execute.return_value = result_mock
 
-        # Simular o job criado
-        with patch("app.services.job_service.Job", return_value=job):
-            service = JobService(db)
-            result = await service.create_job(JobType.HOCKEY)
+        service = JobService(db)
+        result = await service.create_job(JobType.HOCKEY)
 
-        db.add.assert_called_once_with(job)
-        db.flush.assert_called_once()
+        sql = str(db.execute.await_args.args[0])
+        assert sql.startswith("INSERT INTO jobs")
+        assert "RETURNING" in sql
+        db.add.assert_not_called()
+        db.commit.assert_awaited_once()
         assert result is job
 
-    @pytest.mark.asyncio
     async def test_create_job_sets_pending_status(self) -> None:
         """Job criado deve ter status PENDING."""
         db = make_mock_db()
-        job = make_mock_job(status=JobStatus.PENDING)
+        db.execute.return_value = MagicMock()
 
-        with patch("app.services.job_service.Job", return_value=job):
-            service = JobService(db)
-            result = await service.create_job(JobType.OSCAR)
+        service = JobService(db)
+        await service.create_job(JobType.OSCAR)
 
-        assert result.status == JobStatus.PENDING
+        params = db.execute.await_args.args[0].compile().params
+        assert params["status"] == JobStatus.PENDING
+        assert params["type"] == JobType.OSCAR
 
 
 class TestJobServiceGet:
     """Testes de consulta de jobs."""
 
-    @pytest.mark.asyncio
     async def test_get_job_returns_none_when_not_found(self) -> None:
         """get_job() deve retornar None se o job não existir."""
         db = make_mock_db()
@@ -92,7 +109,6 @@ class TestJobServiceGet:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_job_returns_job_when_found(self) -> None:
         """get_job() deve retornar o job se existir."""
         job = make_mock_job()
@@ -106,15 +122,12 @@ class TestJobServiceGet:
 
         assert result is job
 
-    @pytest.mark.asyncio
     async def test_list_jobs_returns_all(self) -> None:
         """list_jobs() deve retornar todos os jobs."""
-        jobs = [make_mock_job(), make_mock_job()]
+        rows = [{"id": uuid.uuid4()}, {"id": uuid.uuid4()}]
         db = make_mock_db()
-        scalars_mock = MagicMock()
-        scalars_mock.all.return_value = jobs
         result_mock = MagicMock()
-        result_mock.scalars.return_value = scalars_mock
+        result_mock.mappings.return_value.all.return_value = rows
         db.execute.return_value = result_mock
 
         service = JobService(db)
@@ -123,61 +136,281 @@ class TestJobServiceGet:
         assert len(result) == 2
 
 
+def executed_update(db: MagicMock) -> dict:
+    """Helper: devolve os valores do UPDATE executado no mock de sessão."""
+    stmt = db.execute.await_args.args[0]
+    assert str(stmt).startswith("UPDATE jobs")
+    return stmt.compile().params
+
+
 class TestJobServiceStatusUpdate:
     """Testes de atualização de status."""
 
-    @pytest.mark.asyncio
     async def test_mark_running_updates_status(self) -> None:
         """mark_running() deve atualizar o status do job para RUNNING."""
-        job = make_mock_job(status=JobStatus.PENDING)
         db = make_mock_db()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
-        db.execute.return_value = result_mock
 
         service = JobService(db)
-        await service.mark_running(job.id)
+        await service.mark_running(uuid.uuid4())
 
-        assert job.status == JobStatus.RUNNING
+        db.execute.assert_awaited_once()
+        params = executed_update(db)
+        assert params["status"] == JobStatus.RUNNING
 
-    @pytest.mark.asyncio
     async def test_mark_completed_updates_status_and_count(self) -> None:
         """mark_completed() deve definir status e items_collected."""
-        job = make_mock_job(status=JobStatus.RUNNING)
         db = make_mock_db()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
-        db.execute.return_value = result_mock
 
         service = JobService(db)
-        await service.mark_completed(job.id, items_collected=150)
+        await service.mark_completed(uuid.uuid4(), items_collected=150)
 
-        assert job.status == JobStatus.COMPLETED
-        assert job.items_collected == 150
+        params = executed_update(db)
+        assert params["status"] == JobStatus.COMPLETED
+        assert params["items_collected"] == 150
 
-    @pytest.mark.asyncio
     async def test_mark_failed_saves_error_message(self) -> None:
         """mark_failed() deve definir status FAILED e salvar a mensagem de erro."""
-        job = make_mock_job(status=JobStatus.RUNNING)
         db = make_mock_db()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
-        db.execute.return_value = result_mock
 
         service = JobService(db)
-        await service.mark_failed(job.id, error="Connection timeout")
+        await service.mark_failed(uuid.uuid4(), error="Connection timeout")
 
-        assert job.status == JobStatus.FAILED
-        assert job.error_message == "Connection timeout"
+        params = executed_update(db)
+        assert params["status"] == JobStatus.FAILED
+        assert params["error_message"] == "Connection timeout"
 
-    @pytest.mark.asyncio
-    async def test_mark_running_noop_when_job_not_found(self) -> None:
-        """Atualizar status de job inexistente não deve lançar exceção."""
+    async def test_mark_running_raises_when_job_not_found(self) -> None:
+        """UPDATE ... RETURNING sem linha deve lançar JobNotFoundError."""
         db = make_mock_db()
         result_mock = MagicMock()
         result_mock.scalar_one_or_none.return_value = None
         db.execute.return_value = result_mock
 
         service = JobService(db)
-        # Não deve lançar exceção
+        with pytest.raises(JobNotFoundError):
+            await service.mark_running(uuid.uuid4())
+
+    async def test_status_update_returns_id_and_uses_server_time(self) -> None:
+        """O UPDATE deve ter RETURNING e usar now() do servidor em updated_at."""
+        db = make_mock_db()
+
+        service = JobService(db)
         await service.mark_running(uuid.uuid4())
+
+        sql = str(db.execute.await_args.args[0])
+        assert "updated_at=now()" in sql
+        assert "RETURNING jobs.id" in sql
+
+
+class TestJobServiceResultsPage:
+    """Testes da paginação por cursor das listagens globais."""
+
+    async def test_hockey_page_streams_after_cursor(self) -> None:
+        """stream_hockey_page() deve filtrar id > cursor, ordenar por id e limitar."""
+
+        async def rows():
+            yield {"id": 11}
+
+        db = make_mock_db()
+        stream_result = MagicMock()
+        stream_result.mappings.return_value = rows()
+        db.stream = AsyncMock(return_value=stream_result)
+
+        service = JobService(db)
+        received = [row async for row in service.stream_hockey_page(limit=50, cursor=10)]
+
+        stmt = db.stream.await_args.args[0]
+        sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+        assert "hockey_teams.id > 10" in sql
+        assert "ORDER BY hockey_teams.id" in sql
+        assert "LIMIT 50" in sql
+        assert stmt.get_execution_options()["yield_per"] == STREAM_CHUNK_SIZE
+        assert received == [{"id": 11}]
+
+
+class TestJobServiceResultsByJob:
+    """Testes da consulta de resultados de um job."""
+
+    async def test_hockey_results_by_job_selects_columns(self) -> None:
+        """Deve selecionar colunas (mapeamentos), sem carregar entidades ORM."""
+        db = make_mock_db()
+        result_mock = MagicMock()
+        result_mock.mappings.return_value.all.return_value = [{"id": 1}]
+        db.execute.return_value = result_mock
+
+        service = JobService(db)
+        rows = await service.get_hockey_results_by_job(uuid.uuid4())
+
+        stmt = db.execute.await_args.args[0]
+        assert stmt.column_descriptions[0]["name"] == "id"  # coluna, não a entidade
+        assert "hockey_teams.team_name" in str(stmt)
+        assert "ORDER BY hockey_teams.id" in str(stmt)
+        assert rows == [{"id": 1}]
+
+
+class TestJobServiceResultCounts:
+    """Testes das contagens de resultados por job."""
+
+    async def test_count_hockey_results_uses_sql_count(self) -> None:
+        """count_hockey_results_by_job() deve usar COUNT filtrado pelo job."""
+        db = make_mock_db()
+        result_mock = MagicMock()
+        result_mock.scalar_one.return_value = 42
+        db.execute.return_value = result_mock
+
+        service = JobService(db)
+        count = await service.count_hockey_results_by_job(uuid.uuid4())
+
+        sql = str(db.execute.await_args.args[0])
+        assert "count(*)" in sql
+        assert "hockey_teams.job_id" in sql
+        assert count == 42
+
+    async def test_count_oscar_results_uses_sql_count(self) -> None:
+        """count_oscar_results_by_job() deve contar na tabela do Oscar."""
+        db = make_mock_db()
+        result_mock = MagicMock()
+        result_mock.scalar_one.return_value = 7
+        db.execute.return_value = result_mock
+
+        service = JobService(db)
+        count = await service.count_oscar_results_by_job(uuid.uuid4())
+
+        sql = str(db.execute.await_args.args[0])
+        assert "FROM oscar_films" in sql
+        assert count == 7
+
+
+class TestJobServiceAddResults:
+    """Testes da inserção em lote dos resultados coletados."""
+
+    async def test_add_hockey_results_replaces_previous_rows(self) -> None:
+        """Deve remover linhas de tentativas anteriores e inserir em um único lote."""
+        db = make_mock_db()
+        job_id = uuid.uuid4()
+        records = [{"team_name": "A", "year": 1990}, {"team_name": "B", "year": 1991}]
+
+        service = JobService(db)
+        inserted = await service.add_hockey_results(job_id, records)
+
+        delete_call, insert_call, _ = db.execute.await_args_list
+        assert str(delete_call.args[0]).startswith("DELETE FROM hockey_teams")
+        assert [p["job_id"] for p in insert_call.args[1]] == [job_id, job_id]
+        assert inserted == 2
+        db.add.assert_not_called()
+
+    async def test_add_oscar_results_splits_large_batches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Listas maiores que BULK_INSERT_BATCH_SIZE devem ser divididas em lotes."""
+        monkeypatch.setattr(job_service, "COPY_THRESHOLD", BULK_INSERT_BATCH_SIZE * 2)
+        db = make_mock_db()
+        records = [{"title": f"Film {i}", "year": 2000} for i in range(BULK_INSERT_BATCH_SIZE + 1)]
+
+        service = JobService(db)
+        inserted = await service.add_oscar_results(uuid.uuid4(), records)
+
+        batches = [call.args[1] for call in db.execute.await_args_list[1:-1]]
+        assert [len(batch) for batch in batches] == [BULK_INSERT_BATCH_SIZE, 1]
+        assert inserted == BULK_INSERT_BATCH_SIZE + 1
+
+    async def test_add_oscar_results_empty_skips_insert(self) -> None:
+        """Lista vazia não deve gerar INSERT (apenas a limpeza do job e a versão)."""
+        db = make_mock_db()
+
+        service = JobService(db)
+        inserted = await service.add_oscar_results(uuid.uuid4(), [])
+
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert statements[0].startswith("DELETE FROM oscar_films")
+        assert statements[1].startswith("INSERT INTO result_versions")
+        assert len(statements) == 2
+        assert inserted == 0
+
+    async def test_large_batches_use_copy(self) -> None:
+        """A partir de COPY_THRESHOLD linhas, deve gravar com COPY preenchendo os defaults."""
+        db = make_mock_db()
+        raw = MagicMock()
+        raw.driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw)
+        db.connection = AsyncMock(return_value=connection)
+        job_id = uuid.uuid4()
+        records = [
+            {"year": 2000, "title": f"Film {i}", "nominations": 1, "awards": 0}
+            for i in range(COPY_THRESHOLD)
+        ]
+
+        service = JobService(db)
+        inserted = await service.add_oscar_results(job_id, records)
+
+        copy = raw.driver_connection.copy_records_to_table
+        copy.assert_awaited_once()
+        assert copy.await_args.args == ("oscar_films",)
+        columns = copy.await_args.kwargs["columns"]
+        first = dict(zip(columns, copy.await_args.kwargs["records"][0], strict=True))
+        assert "id" not in columns
+        assert first["job_id"] == job_id
+        assert first["best_picture"] is False
+        assert first["created_at"] is not None
+        assert inserted == COPY_THRESHOLD
+        assert db.execute.await_count == 2  # apenas o DELETE e a versão
+
+    async def test_add_results_bumps_table_version(self) -> None:
+        """Toda gravação deve incrementar a versão da tabela na mesma transação."""
+        db = make_mock_db()
+
+        await JobService(db).add_hockey_results(uuid.uuid4(), [{"team_name": "A"}])
+
+        statement = db.execute.await_args_list[-1].args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO result_versions")
+        assert "ON CONFLICT (table_name) DO UPDATE" in sql
+        assert "version = (result_versions.version + " in sql
+        assert statement.compile().params["table_name"] == "hockey_teams"
+
+    async def test_use_async_commit_is_transaction_local(self) -> None:
+        """O synchronous_commit deve ser desligado só na transação atual."""
+        db = make_mock_db()
+
+        await JobService(db).use_async_commit()
+
+        statement = db.execute.await_args.args[0]
+        assert str(statement) == "SET LOCAL synchronous_commit = OFF"
+
+
+class TestJobEnumColumns:
+    """type/status são VARCHAR com CHECK, gravando o valor do enum."""
+
+    def test_columns_use_check_constraint_instead_of_pg_enum(self) -> None:
+        """O DDL não deve criar tipos ENUM nativos do Postgres."""
+        ddl = str(CreateTable(Job.__table__).compile(dialect=postgresql.dialect()))
+
+        assert "type VARCHAR(16) NOT NULL" in ddl
+        assert "CHECK (status IN ('pending', 'running', 'completed', 'failed'))" in ddl
+
+    def test_enum_value_is_stored(self) -> None:
+        """O valor gravado deve ser o value ("running"), não o nome do membro."""
+        status_type = Job.__table__.c.status.type
+        bind = status_type.bind_processor(postgresql.dialect())
+
+        assert bind(JobStatus.RUNNING) == "running"
+
+
+class TestJobIds:
+    """PK dos jobs em UUIDv7."""
+
+    def test_uuid7_version_and_variant(self) -> None:
+        """O id gerado deve ser um UUID versão 7 no layout RFC."""
+        job_id = uuid7()
+
+        assert job_id.version == 7
+        assert job_id.variant == uuid.RFC_4122
+
+    def test_uuid7_is_time_ordered(self) -> None:
+        """Ids gerados em milissegundos distintos devem crescer com o tempo."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
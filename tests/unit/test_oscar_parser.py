@@ -5,10 +5,13 @@ Testa a lógica de parsing sem inicializar o Selenium/WebDriver,
 usando mocks para simular o comportamento dos elementos do browser.
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from bs4 import BeautifulSoup
 
+from app.crawlers import oscar_crawler
 from app.crawlers.oscar_crawler import OscarCrawler
 
 
@@ -17,48 +20,54 @@ def crawler() -> OscarCrawler:
     return OscarCrawler()
 
 
-def make_mock_row(title: str, nominations: int, awards: int, best_picture: str) -> MagicMock:
-    """Helper: cria um mock de linha da tabela Selenium."""
-    row = MagicMock()
+@pytest.fixture
+def fresh_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isola o pool de drivers do módulo entre os testes."""
+    monkeypatch.setattr(oscar_crawler, "_driver_pool", None)
+    monkeypatch.setattr(oscar_crawler, "_driver_slots", None)
+
 
-    def find_element_side_effect(by, css):
-        cell = MagicMock()
-        mapping = {
-            "td.film-title": title,
-            "td.film-nominations": str(nominations),
-            "td.film-awards": str(awards),
-            "td.film-best-picture": best_picture,
-        }
-        cell.text = mapping.get(css, "")
-        return cell
+def make_script_row(title: str, nominations: int, awards: int, best_picture: str) -> dict:
+    """Helper: cria uma linha como devolvida pelo FILM_TABLE_SCRIPT."""
+    return {
+        "title": title,
+        "nominations": str(nominations),
+        "awards": str(awards),
+        "best_picture": bool(best_picture),
+    }
 
-    row.find_element.side_effect = find_element_side_effect
-    return row
+
+@pytest.fixture(scope="module")
+def parsed_oscar_records() -> list[dict]:
+    """Registros de uma tabela de 2010 (driver simulado), calculados uma vez por módulo."""
+    driver = MagicMock()
+    driver.execute_script.return_value = [
+        make_script_row("The Hurt Locker", 9, 6, "*"),
+        make_script_row("Avatar", 9, 3, ""),
+    ]
+    return OscarCrawler()._parse_film_table(driver, year=2010)
 
 
 class TestOscarParser:
     """Testes para _parse_film_table do OscarCrawler."""
 
-    def test_parse_film_table_returns_records(self, crawler: OscarCrawler) -> None:
-        """Deve retornar um dict por linha da tabela."""
+    def test_parse_film_table_uses_single_script_call(self, crawler: OscarCrawler) -> None:
+        """A tabela deve ser lida com um único execute_script, sem find_element."""
         driver = MagicMock()
-        driver.find_elements.return_value = [
-            make_mock_row("The Hurt Locker", 9, 6, "*"),
-            make_mock_row("Avatar", 9, 3, ""),
-        ]
+        driver.execute_script.return_value = [make_script_row("Avatar", 9, 3, "")]
 
-        records = crawler._parse_film_table(driver, year=2010)
-        assert len(records) == 2
+        crawler._parse_film_table(driver, year=2010)
 
-    def test_parse_film_table_correct_fields(self, crawler: OscarCrawler) -> None:
-        """Os campos de cada registro devem estar corretos."""
-        driver = MagicMock()
-        driver.find_elements.return_value = [
-            make_mock_row("The Hurt Locker", 9, 6, "*"),
-        ]
+        driver.execute_script.assert_called_once_with(oscar_crawler.FILM_TABLE_SCRIPT)
+        driver.find_elements.assert_not_called()
 
-        records = crawler._parse_film_table(driver, year=2010)
-        record = records[0]
+    def test_parse_film_table_returns_records(self, parsed_oscar_records: list[dict]) -> None:
+        """Deve retornar um dict por linha da tabela."""
+        assert len(parsed_oscar_records) == 2
+
+    def test_parse_film_table_correct_fields(self, parsed_oscar_records: list[dict]) -> None:
+        """Os campos de cada registro devem estar corretos."""
+        record = parsed_oscar_records[0]
 
         assert record["year"] == 2010
         assert record["title"] == "The Hurt Locker"
@@ -66,24 +75,21 @@ class TestOscarParser:
         assert record["awards"] == 6
         assert record["best_picture"] is True
 
-    def test_parse_film_table_best_picture_false(self, crawler: OscarCrawler) -> None:
+    def test_parse_film_table_best_picture_false(self, parsed_oscar_records: list[dict]) -> None:
         """Campo best_picture deve ser False quando a célula estiver vazia."""
-        driver = MagicMock()
-        driver.find_elements.return_value = [
-            make_mock_row("Avatar", 9, 3, ""),
-        ]
-
-        records = crawler._parse_film_table(driver, year=2010)
-        assert records[0]["best_picture"] is False
+        assert parsed_oscar_records[1]["best_picture"] is False
 
     def test_parse_film_table_skips_bad_rows(self, crawler: OscarCrawler) -> None:
-        """Linhas que lançam exceção devem ser ignoradas sem parar o loop."""
-        good_row = make_mock_row("Good Film", 5, 2, "")
-        bad_row = MagicMock()
-        bad_row.find_element.side_effect = Exception("element not found")
+        """Linhas incompletas ou com números inválidos devem ser ignoradas."""
+        bad_number = make_script_row("Bad Film", 0, 0, "")
+        bad_number["nominations"] = "n/a"
 
         driver = MagicMock()
-        driver.find_elements.return_value = [bad_row, good_row]
+        driver.execute_script.return_value = [
+            None,
+            bad_number,
+            make_script_row("Good Film", 5, 2, ""),
+        ]
 
         records = crawler._parse_film_table(driver, year=2020)
         assert len(records) == 1
@@ -92,16 +98,110 @@ class TestOscarParser:
     def test_parse_film_table_empty(self, crawler: OscarCrawler) -> None:
         """Tabela sem linhas deve retornar lista vazia."""
         driver = MagicMock()
-        driver.find_elements.return_value = []
+        driver.execute_script.return_value = []
 
         records = crawler._parse_film_table(driver, year=2010)
         assert records == []
 
-    @pytest.mark.asyncio
-    async def test_crawl_delegates_to_executor(self, crawler: OscarCrawler) -> None:
-        """crawl() deve chamar _run_selenium via executor sem executá-lo diretamente."""
-        with patch.object(crawler, "_run_selenium", return_value=[{"year": 2010, "title": "Test"}]):
-            # Simular executor chamando a função síncrona
-            with patch("asyncio.get_event_loop"):
-                mock_executor = MagicMock()
-                mock_executor.return_value = [{"year": 2010, "title": "Test"}]
+    async def test_crawl_delegates_to_executor(
+        self, crawler: OscarCrawler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """crawl() deve executar _run_selenium nas threads dedicadas do Selenium."""
+        monkeypatch.setattr(oscar_crawler.settings, "oscar_use_selenium", True)
+        driver = MagicMock()
+        thread_names: list[str] = []
+
+        def fake_run(received_driver: MagicMock) -> list[dict]:
+            thread_names.append(threading.current_thread().name)
+            assert received_driver is driver
+            return [{"year": 2010, "title": "Test"}]
+
+        with (
+            patch.object(OscarCrawler, "_acquire_driver", AsyncMock(return_value=driver)),
+            patch.object(OscarCrawler, "_release_driver", AsyncMock()) as release,
+            patch.object(crawler, "_run_selenium", side_effect=fake_run),
+        ):
+            records = await crawler.crawl()
+
+        assert records == [{"year": 2010, "title": "Test"}]
+        assert thread_names[0].startswith("selenium")
+        release.assert_awaited_once_with(driver, healthy=True)
+
+
+@pytest.mark.usefixtures("fresh_pool")
+class TestOscarDriverPool:
+    """Testes do pool de WebDrivers reutilizados entre jobs."""
+
+    async def test_driver_is_reused_after_release(self) -> None:
+        """Driver devolvido saudável deve ser reutilizado no próximo acquire."""
+        with patch.object(
+            OscarCrawler, "_create_driver", side_effect=lambda: MagicMock()
+        ) as create:
+            driver = await OscarCrawler._acquire_driver()
+            await OscarCrawler._release_driver(driver, healthy=True)
+            again = await OscarCrawler._acquire_driver()
+
+        assert again is driver
+        assert create.call_count == 1
+        driver.delete_all_cookies.assert_called_once()
+        driver.get.assert_called_once_with("about:blank")
+
+    async def test_failed_driver_is_discarded(self) -> None:
+        """Driver com erro deve ser encerrado e um novo criado no próximo acquire."""
+        with patch.object(
+            OscarCrawler, "_create_driver", side_effect=lambda: MagicMock()
+        ) as create:
+            driver = await OscarCrawler._acquire_driver()
+            await OscarCrawler._release_driver(driver, healthy=False)
+            again = await OscarCrawler._acquire_driver()
+
+        driver.quit.assert_called_once()
+        assert again is not driver
+        assert create.call_count == 2
+
+
+class TestOscarAjaxParser:
+    """Testes da normalização do JSON retornado pelo endpoint AJAX."""
+
+    def test_parse_years_extracts_year_links(self, crawler: OscarCrawler) -> None:
+        """Deve retornar os anos dos links `a.year-link` em ordem."""
+        html = """
+        <a href="#" class="year-link" id="2015">2015</a>
+        <a href="#" class="year-link" id="2014">2014</a>
+        <a href="#" class="other-link">Home</a>
+        """
+        assert crawler._parse_years(BeautifulSoup(html, "lxml")) == [2015, 2014]
+
+    def test_parse_year_payload_fields(self, crawler: OscarCrawler) -> None:
+        """Campos devem ser normalizados e best_picture ausente vira False."""
+        payload = [
+            {"title": "Spotlight ", "nominations": 6, "awards": 2, "best_picture": True},
+            {"title": "Mad Max: Fury Road", "nominations": 10, "awards": 6},
+        ]
+
+        records = crawler._parse_year_payload(payload, year=2015)
+
+        assert records == [
+            {
+                "year": 2015,
+                "title": "Spotlight",
+                "nominations": 6,
+                "awards": 2,
+                "best_picture": True,
+            },
+            {
+                "year": 2015,
+                "title": "Mad Max: Fury Road",
+                "nominations": 10,
+                "awards": 6,
+                "best_picture": False,
+            },
+        ]
+
+    def test_parse_year_payload_skips_bad_items(self, crawler: OscarCrawler) -> None:
+        """Itens incompletos devem ser ignorados sem interromper o parsing."""
+        payload = [{"title": "No counts"}, {"title": "Ok", "nominations": 1, "awards": 0}]
+
+        records = crawler._parse_year_payload(payload, year=2010)
+
+        assert [r["title"] for r in records] == ["Ok"]
@@ -0,0 +1,121 @@
+"""
+Testes unitários do QueuePublisher e da declaração da fila.
+
+Usa mock do canal aio-pika para validar a publicação em lote sem
+precisar de um RabbitMQ real.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aio_pika import DeliveryMode
+
+from app.schemas.job import CrawlMessage, JobType
+from app.services import queue_service
+from app.services.queue_service import QueuePublisher, declare_crawl_queue
+
+
+def make_publisher(publish: AsyncMock) -> QueuePublisher:
+    """Cria um QueuePublisher com canal falso e a task de lote iniciada."""
+    publisher = QueuePublisher()
+    channel = MagicMock()
+    channel.default_exchange.publish = publish
+    publisher._channel = channel
+    publisher._exchange = channel.default_exchange
+    publisher._start_publish_loop()
+    return publisher
+
+
+class TestQueuePublisherBatching:
+    """Testes da publicação em lote."""
+
+    async def test_concurrent_publishes_are_all_sent(self) -> None:
+        """Mensagens publicadas concorrentemente devem ser enviadas e confirmadas."""
+        publish = AsyncMock()
+        publisher = make_publisher(publish)
+
+        messages = [CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.HOCKEY) for _ in range(5)]
+        await asyncio.gather(*(publisher.publish(m) for m in messages))
+        await publisher.disconnect()
+
+        assert publish.await_count == 5
+
+    async def test_publish_error_is_propagated_to_caller(self) -> None:
+        """Falha do broker deve ser repassada a quem chamou publish()."""
+        publisher = make_publisher(AsyncMock(side_effect=ConnectionError("nack")))
+
+        with pytest.raises(ConnectionError):
+            await publisher.publish(CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.OSCAR))
+        await publisher.disconnect()
+
+    async def test_publish_requires_connection(self) -> None:
+        """publish() sem connect() deve lançar RuntimeError."""
+        with pytest.raises(RuntimeError):
+            await QueuePublisher().publish(CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.ALL))
+
+    async def test_publish_uses_transient_delivery_by_default(self) -> None:
+        """Mensagens de agendamento devem ser transitórias por padrão."""
+        publish = AsyncMock()
+        publisher = make_publisher(publish)
+
+        await publisher.publish(CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.HOCKEY))
+        await publisher.disconnect()
+
+        sent = publish.await_args.args[0]
+        assert sent.delivery_mode == DeliveryMode.NOT_PERSISTENT
+
+    async def test_publish_is_not_mandatory(self) -> None:
+        """A fila é declarada no connect(); o broker não precisa devolver mensagens."""
+        publish = AsyncMock()
+        publisher = make_publisher(publish)
+
+        await publisher.publish(CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.HOCKEY))
+        await publisher.disconnect()
+
+        assert publish.await_args.kwargs["mandatory"] is False
+
+    async def test_publish_body_round_trips_through_crawl_message(self) -> None:
+        """O corpo gerado com orjson deve ser aceito pela validação do consumer."""
+        publish = AsyncMock()
+        publisher = make_publisher(publish)
+        message = CrawlMessage(job_id=uuid.uuid4(), job_type=JobType.ALL)
+
+        await publisher.publish(message)
+        await publisher.disconnect()
+
+        sent = publish.await_args.args[0]
+        assert CrawlMessage.model_validate_json(sent.body) == message
+
+
+class TestDeclareCrawlQueue:
+    """Testes da declaração da fila de crawling."""
+
+    async def test_dead_letter_exchange_is_declared_and_bound(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A fila deve apontar para o DLX, que entrega na fila '.dead'."""
+        monkeypatch.setattr(queue_service.settings, "queue_dead_letter_exchange", "jobs.dlx")
+        channel = MagicMock()
+        channel.declare_exchange = AsyncMock()
+        dead_queue = MagicMock(bind=AsyncMock())
+        channel.declare_queue = AsyncMock(side_effect=[dead_queue, MagicMock()])
+
+        await declare_crawl_queue(channel)
+
+        dead_call, main_call = channel.declare_queue.await_args_list
+        assert dead_call.args == (f"{queue_service.settings.queue_name}.dead",)
+        assert main_call.kwargs["arguments"]["x-dead-letter-exchange"] == "jobs.dlx"
+        dead_queue.bind.assert_awaited_once_with(channel.declare_exchange.return_value)
+
+    async def test_dead_letter_is_opt_in(self) -> None:
+        """Por padrão a fila é declarada sem argumentos (compatível com filas existentes)."""
+        channel = MagicMock()
+        channel.declare_exchange = AsyncMock()
+        channel.declare_queue = AsyncMock()
+
+        await declare_crawl_queue(channel)
+
+        channel.declare_exchange.assert_not_awaited()
+        assert channel.declare_queue.await_args.kwargs["arguments"] == {}
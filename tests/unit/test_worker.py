@@ -0,0 +1,186 @@
+"""
+Testes unitários do consumo em lote do Worker.
+
+Usa mensagens simuladas (sem RabbitMQ) para validar o agrupamento das
+entregas e o ACK único por lote.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from worker import main as worker
+
+
+def make_message(tag: int) -> MagicMock:
+    """Cria uma mensagem simulada com ack/reject assíncronos."""
+    message = MagicMock(delivery_tag=tag)
+    message.ack = AsyncMock()
+    message.reject = AsyncMock()
+    return message
+
+
+class TestCollectBatch:
+    """Testes do agrupamento das entregas em lotes."""
+
+    async def test_stops_at_batch_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """O lote não deve passar de worker_batch_size mensagens."""
+        monkeypatch.setattr(worker.settings, "worker_batch_size", 2)
+        inbox: asyncio.Queue = asyncio.Queue()
+        for tag in (1, 2, 3):
+            inbox.put_nowait(make_message(tag))
+
+        batch = await worker.collect_batch(inbox)
+
+        assert [m.delivery_tag for m in batch] == [1, 2]
+        assert inbox.qsize() == 1
+
+    async def test_returns_partial_batch_after_timeout(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sem novas entregas, o lote parcial deve sair após o timeout."""
+        monkeypatch.setattr(worker.settings, "worker_batch_timeout", 0.01)
+        inbox: asyncio.Queue = asyncio.Queue()
+        inbox.put_nowait(make_message(1))
+
+        batch = await worker.collect_batch(inbox)
+
+        assert [m.delivery_tag for m in batch] == [1]
+
+
+class TestProcessBatch:
+    """Testes do processamento e da confirmação (ACK) dos lotes."""
+
+    async def test_acks_whole_batch_once(self) -> None:
+        """Lote sem falhas deve ser confirmado com um único ACK multiple."""
+        batch = [make_message(1), make_message(2), make_message(3)]
+
+        with patch.object(worker, "process_message", AsyncMock()):
+            await worker.process_batch(batch)
+
+        batch[-1].ack.assert_awaited_once_with(multiple=True)
+        batch[0].ack.assert_not_awaited()
+        batch[1].ack.assert_not_awaited()
+
+    async def test_rejects_only_failed_messages(self) -> None:
+        """Mensagem com falha deve ser rejeitada; as demais, confirmadas."""
+        ok, bad = make_message(1), make_message(2)
+
+        async def fake_process(message: MagicMock) -> None:
+            if message is bad:
+                raise ValueError("payload inválido")
+
+        with patch.object(worker, "process_message", AsyncMock(side_effect=fake_process)):
+            await worker.process_batch([ok, bad])
+
+        ok.ack.assert_awaited_once_with()
+        bad.reject.assert_awaited_once_with(requeue=False)
+        bad.ack.assert_not_awaited()
+
+    async def test_limits_concurrent_jobs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No máximo worker_concurrency jobs do lote devem rodar ao mesmo tempo."""
+        monkeypatch.setattr(worker.settings, "worker_concurrency", 2)
+        running = 0
+        peak = 0
+
+        async def fake_process(message: MagicMock) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with patch.object(worker, "process_message", AsyncMock(side_effect=fake_process)):
+            await worker.process_batch([make_message(tag) for tag in range(1, 6)])
+
+        assert peak == 2
+
+    async def test_transient_error_requeues_first_delivery_only(self) -> None:
+        """Falha transitória volta para a fila só na primeira entrega."""
+        first, again = make_message(1), make_message(2)
+        first.redelivered = False
+        again.redelivered = True
+
+        with patch.object(
+            worker, "process_message", AsyncMock(side_effect=ConnectionError("reset"))
+        ):
+            await worker.process_batch([first, again])
+
+        first.reject.assert_awaited_once_with(requeue=True)
+        again.reject.assert_awaited_once_with(requeue=False)
+
+
+class TestProcessMessage:
+    """Testes do processamento de um job."""
+
+    async def test_all_job_runs_crawlers_concurrently(self) -> None:
+        """Job ALL deve rodar os dois crawlers ao mesmo tempo e somar os itens."""
+        hockey_started = asyncio.Event()
+        oscar_started = asyncio.Event()
+
+        # Cada crawler só termina quando o outro já começou (sequencial travaria)
+        async def hockey_crawl(self) -> list[dict]:
+            hockey_started.set()
+            await oscar_started.wait()
+            return [{"team_name": "A"}]
+
+        async def oscar_crawl(self) -> list[dict]:
+            oscar_started.set()
+            await hockey_started.wait()
+            return [{"title": "B"}, {"title": "C"}]
+
+        service = MagicMock()
+        service.add_hockey_results = AsyncMock(return_value=1)
+        service.add_oscar_results = AsyncMock(return_value=2)
+        for method in ("mark_running", "mark_completed", "mark_failed", "use_async_commit"):
+            setattr(service, method, AsyncMock())
+
+        db = MagicMock(commit=AsyncMock(), rollback=AsyncMock())
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=db)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        message = make_message(1)
+        message.body = b'{"job_id": "00000000-0000-0000-0000-000000000001", "job_type": "all"}'
+
+        with (
+            patch.object(worker, "AsyncSessionFactory", session_factory),
+            patch.object(worker, "JobService", return_value=service),
+            patch.object(worker.HockeyCrawler, "crawl", hockey_crawl),
+            patch.object(worker.OscarCrawler, "crawl", oscar_crawl),
+        ):
+            await asyncio.wait_for(worker.process_message(message), timeout=1)
+
+        service.mark_completed.assert_awaited_once()
+        assert service.mark_completed.await_args.kwargs["items_collected"] == 3
+        service.mark_failed.assert_not_awaited()
+
+
+class TestCrawlAll:
+    """Testes da coleta concorrente dos jobs ALL."""
+
+    async def test_failure_cancels_sibling_and_keeps_original_error(self) -> None:
+        """A falha de um crawler deve cancelar o outro e sair sem ExceptionGroup."""
+        oscar_cancelled = asyncio.Event()
+
+        async def hockey_crawl(self) -> list[dict]:
+            await asyncio.sleep(0)
+            raise ConnectionError("reset")
+
+        async def oscar_crawl(self) -> list[dict]:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                oscar_cancelled.set()
+                raise
+            return []
+
+        with (
+            patch.object(worker.HockeyCrawler, "crawl", hockey_crawl),
+            patch.object(worker.OscarCrawler, "crawl", oscar_crawl),
+            pytest.raises(ConnectionError),
+        ):
+            await asyncio.wait_for(worker.crawl_all(), timeout=1)
+
+        assert oscar_cancelled.is_set()
@@ -7,112 +7,218 @@ Etapas de cada ciclo de processamento:
   3. Instanciar o crawler correto (hockey ou oscar)
   4. Executar o crawling
   5. Persistir os registros coletados no banco
-  6. Atualizar status para COMPLETED ou FAILED
-  7. Dar acknowledge (ACK) da mensagem na fila
+  6. Atualizar status para COMPLETED ou FAILED (na mesma transação do passo 5)
+  7. Dar acknowledge (ACK) na fila — um único ACK (multiple=True) por lote
+
+Falhas transitórias (rede, banco indisponível) devolvem a mensagem à fila
+uma vez; na segunda entrega o job é marcado como FAILED (ou, se nem isso
+for possível, a mensagem é rejeitada — e vai para o dead-letter, se configurado).
 """
 
 import asyncio
 import logging
-import uuid
+import time
+from typing import Any
 
-import aio_pika
-from sqlalchemy.ext.asyncio import AsyncSession
+import httpx
+import uvloop
+from aio_pika.abc import AbstractIncomingMessage
+from pydantic import TypeAdapter
+from sqlalchemy.exc import InterfaceError, OperationalError
 
 from app.core.config import settings
 from app.core.database import AsyncSessionFactory, create_tables
 from app.crawlers.hockey_crawler import HockeyCrawler
-from app.crawlers.oscar_crawler import OscarCrawler
-from app.models.hockey import HockeyTeam
-from app.models.oscar import OscarFilm
+from app.crawlers.http_client import close_http_client
+from app.crawlers.oscar_crawler import OscarCrawler, close_driver_pool
 from app.schemas.job import CrawlMessage, JobType
-from app.services.job_service import JobService
-from app.services.queue_service import get_consumer_channel
+from app.services.job_service import JobNotFoundError, JobService
+from app.services.queue_service import declare_crawl_queue, get_consumer_channel
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if settings.debug else settings.log_level.upper(),
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Crawlers sem estado por job: uma instância para toda a vida do worker. As
+# conexões ficam nos recursos compartilhados (cliente httpx e pool de drivers
+# Selenium), fechados no shutdown de `main()`.
+hockey_crawler = HockeyCrawler()
+oscar_crawler = OscarCrawler()
+
+# Validador do payload montado uma vez (evita o custo fixo de
+# model_validate_json a cada mensagem)
+CRAWL_MESSAGE_ADAPTER = TypeAdapter(CrawlMessage)
+
+# Erros que costumam passar sozinhos: conexão/timeout com o site ou o banco
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (
+    httpx.TransportError,
+    OSError,
+    OperationalError,
+    InterfaceError,
+)
+
+
+def should_requeue(message: AbstractIncomingMessage, exc: BaseException) -> bool:
+    """Erro transitório na primeira entrega: a mensagem volta para a fila."""
+    return isinstance(exc, TRANSIENT_ERRORS) and not message.redelivered
+
+
+async def crawl_all() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Roda os dois crawlers em paralelo (I/O de rede independente). Com o
+    TaskGroup, a primeira falha cancela o outro crawler, liberando na hora o
+    slot HTTP/driver que ele ocupava. O erro é relançado fora do
+    ExceptionGroup para manter a classificação transitória/definitiva.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            hockey = group.create_task(hockey_crawler.crawl())
+            oscar = group.create_task(oscar_crawler.crawl())
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0]  # noqa: B904 — o grupo só embrulha o erro original
+    return hockey.result(), oscar.result()
+
 
 # ──────────────────────────────────────────────────────────────
 # Lógica de processamento de cada mensagem
 # ──────────────────────────────────────────────────────────────
 async def process_message(
-    message: aio_pika.IncomingMessage,
+    message: AbstractIncomingMessage,
 ) -> None:
     """
-    Callback executado para cada mensagem recebida da fila.
+    Processa uma mensagem recebida da fila (sem ACK — feito por lote).
     Gerencia o ciclo de vida completo: banco + crawling + persistência.
+    Falhas do job são registradas no banco; propaga as transitórias da
+    primeira entrega (para requeue) e os erros que impedem o registro
+    (payload inválido, banco indisponível).
     """
-    async with message.process():  # ACK automático ao sair sem exceção
-        # Etapa 1: deserializar a mensagem
-        payload = CrawlMessage.model_validate_json(message.body)
-        job_id = payload.job_id
-        job_type = payload.job_type
-
-        logger.info("Processando job: id=%s type=%s", job_id, job_type)
-
-        async with AsyncSessionFactory() as db:
-            service = JobService(db)
-
-            try:
-                # Etapa 2: marcar job como RUNNING
-                await service.mark_running(job_id)
-                await db.commit()
-
-                # Etapa 3 e 4: executar crawler(s) conforme tipo do job
-                total_items = 0
-
-                if job_type in (JobType.HOCKEY, JobType.ALL):
-                    total_items += await _run_hockey_crawler(db, job_id)
-
-                if job_type in (JobType.OSCAR, JobType.ALL):
-                    total_items += await _run_oscar_crawler(db, job_id)
-
-                # Etapa 6a: marcar como COMPLETED
-                await service.mark_completed(job_id, items_collected=total_items)
-                await db.commit()
-
-                logger.info(
-                    "Job concluído: id=%s — %d itens coletados",
-                    job_id,
-                    total_items,
-                )
-
-            except Exception as exc:
-                # Etapa 6b: marcar como FAILED em caso de erro
-                logger.error("Job falhou: id=%s — %s", job_id, exc, exc_info=True)
-                await service.mark_failed(job_id, error=str(exc))
-                await db.commit()
-
-
-async def _run_hockey_crawler(db: AsyncSession, job_id: uuid.UUID) -> int:
-    """Executa o crawler de hockey e persiste os registros no banco."""
-    crawler = HockeyCrawler()
-    records = await crawler.crawl()
-
-    # Etapa 5: persistir cada registro associado ao job_id
-    for record in records:
-        team = HockeyTeam(job_id=job_id, **record)
-        db.add(team)
-
-    await db.flush()
-    return len(records)
-
-
-async def _run_oscar_crawler(db: AsyncSession, job_id: uuid.UUID) -> int:
-    """Executa o crawler do Oscar e persiste os registros no banco."""
-    crawler = OscarCrawler()
-    records = await crawler.crawl()
+    # Etapa 1: deserializar a mensagem
+    payload = CRAWL_MESSAGE_ADAPTER.validate_json(message.body)
+    job_id = payload.job_id
+    job_type = payload.job_type
+
+    logger.debug("Processando job: id=%s type=%s", job_id, job_type)
+
+    async with AsyncSessionFactory() as db:
+        service = JobService(db)
+
+        try:
+            # Etapa 2: marcar job como RUNNING
+            await service.mark_running(job_id)
+            await db.commit()
+
+            # Etapa 3 e 4: executar crawler(s) conforme tipo do job.
+            # A coleta roda antes de qualquer escrita: assim nenhuma
+            # transação fica aberta (segurando conexão do pool) durante
+            # o crawling, e os registros de todos os crawlers vão ao
+            # banco juntos.
+            hockey_records: list[dict[str, Any]] | None = None
+            oscar_records: list[dict[str, Any]] | None = None
+
+            if job_type == JobType.ALL:
+                hockey_records, oscar_records = await crawl_all()
+            elif job_type == JobType.HOCKEY:
+                hockey_records = await hockey_crawler.crawl()
+            elif job_type == JobType.OSCAR:
+                oscar_records = await oscar_crawler.crawl()
+
+            # Etapa 5 e 6a: persistir os registros e marcar como COMPLETED
+            # em uma única transação (um só commit por job)
+            if settings.db_results_async_commit:
+                await service.use_async_commit()
+
+            total_items = 0
+            if hockey_records is not None:
+                total_items += await service.add_hockey_results(job_id, hockey_records)
+            if oscar_records is not None:
+                total_items += await service.add_oscar_results(job_id, oscar_records)
+
+            await service.mark_completed(job_id, items_collected=total_items)
+            await db.commit()
+
+            logger.debug(
+                "Job concluído: id=%s — %d itens coletados",
+                job_id,
+                total_items,
+            )
+
+        except JobNotFoundError:
+            # Job removido depois de publicado: nada a marcar, só descarta
+            logger.warning("Job não encontrado, mensagem descartada: id=%s", job_id)
+            await db.rollback()
+
+        except Exception as exc:
+            if should_requeue(message, exc):
+                # Job fica RUNNING até a nova entrega refazê-lo do início
+                logger.warning("Falha transitória, job será reprocessado: id=%s — %s", job_id, exc)
+                await db.rollback()
+                raise
+
+            # Etapa 6b: marcar como FAILED em caso de erro
+            logger.error("Job falhou: id=%s — %s", job_id, exc, exc_info=True)
+            # Descarta a transação dos resultados, se o erro veio do banco
+            await db.rollback()
+            await service.mark_failed(job_id, error=str(exc))
+            await db.commit()
+
+
+async def process_batch(batch: list[AbstractIncomingMessage]) -> None:
+    """
+    Processa um lote de mensagens em paralelo (até `worker_concurrency` jobs
+    ao mesmo tempo) e confirma todas com um único ACK (multiple=True na
+    última entrega). Se alguma falhar, as demais recebem ACK individual; as
+    com falha transitória voltam para a fila e as outras são rejeitadas sem
+    requeue (dead-letter, se configurado) — uma mensagem inválida voltaria para
+    a fila em loop.
+    """
+    # Os lotes são sequenciais: um semáforo por lote limita o total de jobs
+    slots = asyncio.Semaphore(settings.worker_concurrency)
+
+    async def run(message: AbstractIncomingMessage) -> None:
+        async with slots:
+            await process_message(message)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run(m) for m in batch), return_exceptions=True)
+    logger.info(
+        "Lote de %d mensagens processado em %.2fs", len(batch), time.perf_counter() - started
+    )
+
+    if not any(isinstance(result, Exception) for result in results):
+        await batch[-1].ack(multiple=True)
+        return
+
+    for message, result in zip(batch, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error("Erro ao processar mensagem %s", message.delivery_tag, exc_info=result)
+            await message.reject(requeue=should_requeue(message, result))
+        else:
+            await message.ack()
+
+
+async def collect_batch(
+    inbox: asyncio.Queue[AbstractIncomingMessage],
+) -> list[AbstractIncomingMessage]:
+    """
+    Aguarda a primeira mensagem e junta as que chegarem em até
+    `worker_batch_timeout` segundos, até `worker_batch_size` mensagens.
+    """
+    batch = [await inbox.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.worker_batch_timeout
 
-    # Etapa 5: persistir cada registro associado ao job_id
-    for record in records:
-        film = OscarFilm(job_id=job_id, **record)
-        db.add(film)
+    while len(batch) < settings.worker_batch_size:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(inbox.get(), remaining))
+        except TimeoutError:
+            break
 
-    await db.flush()
-    return len(records)
+    return batch
 
 
 # ──────────────────────────────────────────────────────────────
@@ -125,20 +231,31 @@ async def main() -> None:
     """
     logger.info("Iniciando Worker...")
 
-    # Garantir que as tabelas existem
-    await create_tables()
+    # Garantir que as tabelas existem (em geral a API já criou)
+    if settings.db_auto_create_tables:
+        await create_tables()
 
     async with get_consumer_channel() as channel:
         # Declarar a fila (idempotente — cria somente se não existir)
-        queue = await channel.declare_queue(settings.queue_name, durable=True)
+        queue = await declare_crawl_queue(channel)
 
         logger.info("Worker aguardando mensagens na fila '%s'...", settings.queue_name)
 
+        # As entregas caem numa fila local e são processadas em lotes.
+        # (Cancelar o `queue.iterator()` no meio da espera fecharia o consumer.)
+        inbox: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+        await queue.consume(inbox.put)
+
         # Consumir mensagens indefinidamente
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                await process_message(message)
+        try:
+            while True:
+                await process_batch(await collect_batch(inbox))
+        finally:
+            # Encerrar os browsers mantidos pelo pool do OscarCrawler
+            await close_driver_pool()
+            await close_http_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop: event loop em C (libuv), mais rápido no I/O de asyncpg/aio-pika/httpx
+    uvloop.run(main())